@@ -1,13 +1,14 @@
 import typer
 import sys
 import os
-from pathlib import Path
+import types
+import functools
 
-# Add modules directory to path
-sys.path.append(str(Path(__file__).parent / "modules"))
-
-from modules.interactive_ui import WeirdingUI
-from modules.device_setup import DriveDetector
+# Add modules directory to path (the modules import each other by bare name).
+# Guarded so re-importing main, as the test suite does, doesn't grow sys.path.
+_MODULES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "modules")
+if _MODULES_DIR not in sys.path:
+    sys.path.append(_MODULES_DIR)
 
 app = typer.Typer(
     name="weirding-host",
@@ -15,7 +16,46 @@ app = typer.Typer(
     add_completion=False
 )
 
+# Messages shown when a command that needs root is run without it
+_SETUP_MODULE_ROOT_MESSAGE = (
+    "❌ This command requires root privileges for disk operations.",
+    "Please run with sudo using the virtual environment:",
+    "sudo ./venv/bin/python main.py setup-module",
+    "or activate the virtual environment first:",
+    "source venv/bin/activate && sudo python main.py setup-module",
+)
+
+_SETUP_HOST_ROOT_MESSAGE = (
+    "❌ This command requires root privileges for system modifications.",
+    "Please run with sudo using the virtual environment:",
+    "sudo ./.venv/bin/python main.py setup-host",
+    "or activate the virtual environment first:",
+    "source .venv/bin/activate && sudo ./.venv/bin/python main.py setup-host",
+)
+
+_RELABEL_DRIVE_ROOT_MESSAGE = (
+    "❌ This command requires root privileges for drive relabeling.",
+    "Please run with sudo using the virtual environment:",
+    "sudo ./venv/bin/python main.py relabel-drive",
+    "or activate the virtual environment first:",
+    "source venv/bin/activate && sudo python main.py relabel-drive",
+)
+
+def _require_root(message):
+    """Exit with the given message lines unless running as root."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if os.geteuid() != 0:
+                for line in message:
+                    typer.echo(line, err=True)
+                raise typer.Exit(1)
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
 @app.command()
+@_require_root(_SETUP_MODULE_ROOT_MESSAGE)
 def setup_module():
     """
     Set up a new Weirding Module on an external drive.
@@ -23,14 +63,7 @@ def setup_module():
     This interactive process will guide you through converting an external
     storage device into a portable AI server with hardware-adaptive capabilities.
     """
-    # Check if running as root (required for disk operations)
-    if os.geteuid() != 0:
-        typer.echo("❌ This command requires root privileges for disk operations.", err=True)
-        typer.echo("Please run with sudo using the virtual environment:", err=True)
-        typer.echo("sudo ./venv/bin/python main.py setup-module", err=True)
-        typer.echo("or activate the virtual environment first:", err=True)
-        typer.echo("source venv/bin/activate && sudo python main.py setup-module", err=True)
-        raise typer.Exit(1)
+    from modules.interactive_ui import WeirdingUI
     
     ui = WeirdingUI()
     
@@ -99,14 +132,13 @@ def setup_module():
         ui.console.print("\n[blue]Preparing for bootable USB creation...[/blue]")
         
         # Create a simple object to hold the necessary information for ISO writing
-        class SimplePartitionPlan:
-            def __init__(self, device, base_image, module_name):
-                self.device = device
-                self.drive = device  # OSInstaller expects 'drive' attribute
-                self.base_image = base_image
-                self.module_name = module_name
-        
-        partition_plan = SimplePartitionPlan(selected_drive, base_image, module_name)
+        # (OSInstaller expects a 'drive' attribute alongside 'device')
+        partition_plan = types.SimpleNamespace(
+            device=selected_drive,
+            drive=selected_drive,
+            base_image=base_image,
+            module_name=module_name
+        )
         
         # Execute the simplified setup process
         try:
@@ -116,7 +148,7 @@ def setup_module():
                 
                 success = os_installer.install_os(
                     partition_plan,
-                    lambda msg: progress.update(task, description=msg)
+                    _progress_updater(progress, task)
                 )
                 progress.update(task, completed=100)
                 
@@ -124,22 +156,14 @@ def setup_module():
                     ui.show_error("USB Creation Failed", "Failed to create bootable USB drive")
                     raise typer.Exit(1)
             
-            ui.console.print("[green]✅ Bootable USB drive created successfully[/green]")
-            
-            # Step 4: Finalize bootable Weirding Module (skip AI installation for bootable USB)
-            with ui.show_progress_screen("Finalizing Weirding Module") as progress:
-                task = progress.add_task("Finalizing bootable system...", total=100)
-                progress.update(task, description="Bootable Ubuntu system created successfully")
-                progress.update(task, completed=100)
-            
-            ui.console.print("[green]✅ Bootable Weirding Module created successfully[/green]")
-            ui.console.print("[cyan]The USB drive is now a bootable Ubuntu system with AI tools available after boot.[/cyan]")
-            
-            # Step 5: Complete setup
-            ui.console.print("\n[blue]Finalizing setup...[/blue]")
-            ui.console.print("[green]🎉 Weirding Module setup completed successfully![/green]")
-            ui.console.print("[cyan]Your USB drive is now bootable and ready to use![/cyan]")
-            ui.show_completion_summary(selected_drive, mode)
+            # Step 4: Complete setup (AI installation is skipped for bootable USB)
+            ui.show_completion_summary(selected_drive, mode, status_lines=[
+                "[green]✅ Bootable Weirding Module created successfully[/green]",
+                "[cyan]The USB drive is now a bootable Ubuntu system with AI tools available after boot.[/cyan]",
+                "\n[blue]Finalizing setup...[/blue]",
+                "[green]🎉 Weirding Module setup completed successfully![/green]",
+                "[cyan]Your USB drive is now bootable and ready to use![/cyan]",
+            ])
             
         except Exception as e:
             ui.show_error("Setup Failed", f"An error occurred during setup: {str(e)}")
@@ -155,6 +179,7 @@ def setup_module():
         raise typer.Exit(1)
 
 @app.command()
+@_require_root(_SETUP_HOST_ROOT_MESSAGE)
 def setup_host():
     """
     Prepare the current system to work with a Weirding Module.
@@ -162,14 +187,7 @@ def setup_host():
     This command optimizes the host system for mounting and using
     Weirding Modules, including driver installation and performance tuning.
     """
-    # Check if running as root (required for system modifications)
-    if os.geteuid() != 0:
-        typer.echo("❌ This command requires root privileges for system modifications.", err=True)
-        typer.echo("Please run with sudo using the virtual environment:", err=True)
-        typer.echo("sudo ./.venv/bin/python main.py setup-host", err=True)
-        typer.echo("or activate the virtual environment first:", err=True)
-        typer.echo("source .venv/bin/activate && sudo ./.venv/bin/python main.py setup-host", err=True)
-        raise typer.Exit(1)
+    from modules.interactive_ui import WeirdingUI
     
     ui = WeirdingUI()
     
@@ -216,6 +234,10 @@ def setup_host():
 @app.command()
 def list_drives():
     """List all detected storage devices and their suitability for Weirding Module setup."""
+    from modules.interactive_ui import WeirdingUI
+    from modules.device_setup import DriveDetector
+    from rich.console import Group
+    
     detector = DriveDetector()
     ui = WeirdingUI()
     
@@ -229,52 +251,52 @@ def list_drives():
     external_drives = detector.get_external_drives()
     ui.console.print(f"\nFound {len(drives)} total drives, {len(external_drives)} external drives")
     
-    # Show detailed information
+    # Show detailed information, collected and rendered in a single print;
+    # every drive's usage is analyzed, so query them all at once
+    detector.prefetch_drive_usage(drives)
+    lines = []
     for drive in drives:
         meets_req, issues = detector.check_drive_requirements(drive)
         analysis = detector.analyze_drive_usage(drive)
         
         status = "✅ Suitable" if meets_req else "❌ Not suitable"
-        ui.console.print(f"\n{drive.device} - {drive.model} ({detector.format_size(drive.size)}) - {status}")
+        lines.append(f"\n{drive.device} - {drive.model} ({detector.format_size(drive.size)}) - {status}")
         
         if issues:
-            ui.console.print(f"  Issues: {', '.join(issues)}")
+            lines.append(f"  Issues: {', '.join(issues)}")
         
         if analysis['safety_warnings']:
-            ui.console.print(f"  Warnings: {', '.join(analysis['safety_warnings'])}")
+            lines.append(f"  Warnings: {', '.join(analysis['safety_warnings'])}")
+    
+    ui.console.print(Group(*lines))
 
 @app.command()
+@_require_root(_RELABEL_DRIVE_ROOT_MESSAGE)
 def relabel_drive():
     """Relabel an external drive for easy identification."""
-    # Check if running as root (required for drive relabeling)
-    if os.geteuid() != 0:
-        typer.echo("❌ This command requires root privileges for drive relabeling.", err=True)
-        typer.echo("Please run with sudo using the virtual environment:", err=True)
-        typer.echo("sudo ./venv/bin/python main.py relabel-drive", err=True)
-        typer.echo("or activate the virtual environment first:", err=True)
-        typer.echo("source venv/bin/activate && sudo python main.py relabel-drive", err=True)
-        raise typer.Exit(1)
+    from modules.interactive_ui import WeirdingUI
+    from modules.device_setup import DriveDetector
     
     detector = DriveDetector()
     ui = WeirdingUI()
     
     ui.console.print("[blue]Scanning for external drives...[/blue]")
-    drives = detector.scan_drives()
+    detector.scan_drives(external_only=True)
     external_drives = detector.get_external_drives()
     
     if not external_drives:
         ui.console.print("[red]No external drives found.[/red]")
         return
     
-    # Show available drives
-    suitable_drives = [d for d in external_drives if detector.check_drive_requirements(d)[0]]
+    # Only offer drives that passed the requirement check
+    suitable_drives = [d for d in external_drives if detector.is_suitable(d)]
     
     if not suitable_drives:
         ui.console.print("[red]No suitable external drives found for relabeling.[/red]")
         return
     
     # Let user select drive
-    selected_drive = ui.select_drive(external_drives)
+    selected_drive = ui.select_drive(suitable_drives)
     if not selected_drive:
         ui.console.print("No drive selected.")
         return
@@ -298,40 +320,70 @@ def relabel_drive():
 @app.command()
 def version():
     """Show version information."""
-    ui = WeirdingUI()
-    ui.console.print("[bold blue]Weirding Host Utility[/bold blue]")
-    ui.console.print("Version: 0.1.0-alpha")
-    ui.console.print("A tool for creating portable, hardware-adaptive AI servers")
+    typer.echo("Weirding Host Utility")
+    typer.echo("Version: 0.1.0-alpha")
+    typer.echo("A tool for creating portable, hardware-adaptive AI servers")
+
+def _progress_updater(progress, task):
+    """Build a progress callback that only touches the bar when its state changes.
+    
+    Callbacks follow the installer convention of ``(message, percent=None)``.
+    The task description is left alone while a percentage is being reported,
+    so long writes advance the bar without re-rendering the label each tick.
+    """
+    state = {'message': None, 'percent': None}
+    
+    def update(message, percent=None):
+        if percent is not None:
+            percent = int(percent)
+            if percent != state['percent']:
+                state['percent'] = percent
+                progress.update(task, completed=percent)
+        elif message != state['message']:
+            state['message'] = message
+            progress.update(task, description=message)
+    
+    return update
+
+@functools.lru_cache(maxsize=1)
+def _read_cpuinfo():
+    """Parse /proc/cpuinfo once into (physical_cores, model_name)."""
+    cores = set()
+    model = None
+    with open('/proc/cpuinfo', 'r') as f:
+        for line in f:
+            if line.startswith('core id'):
+                cores.add(line.split(':', 1)[1].strip())
+            elif model is None and line.startswith('model name'):
+                model = line.split(':', 1)[1].strip()
+    return len(cores) if cores else 1, model
 
 def _get_cpu_count(logical=False):
     """Get CPU count without psutil dependency."""
+    if logical:
+        try:
+            return len(os.sched_getaffinity(0))
+        except (AttributeError, OSError):
+            return os.cpu_count() or 1
     try:
-        if logical:
-            # Get logical CPU count (including hyperthreading)
-            with open('/proc/cpuinfo', 'r') as f:
-                return len([line for line in f if line.startswith('processor')])
-        else:
-            # Get physical CPU cores
-            cores = set()
-            with open('/proc/cpuinfo', 'r') as f:
-                for line in f:
-                    if line.startswith('core id'):
-                        cores.add(line.split(':')[1].strip())
-            return len(cores) if cores else 1
+        return _read_cpuinfo()[0]
     except:
-        import os
         return os.cpu_count() or 1
 
+@functools.lru_cache(maxsize=1)
 def _get_memory_info():
     """Get memory information without psutil dependency."""
     try:
+        wanted = ('MemTotal', 'MemFree', 'MemAvailable')
+        meminfo = {}
         with open('/proc/meminfo', 'r') as f:
-            meminfo = {}
             for line in f:
-                if ':' in line:
-                    key, value = line.split(':', 1)
+                key, _, value = line.partition(':')
+                if key in wanted:
                     # Convert KB to bytes
-                    meminfo[key.strip()] = int(value.strip().split()[0]) * 1024
+                    meminfo[key] = int(value.split()[0]) * 1024
+                    if 'MemTotal' in meminfo and 'MemAvailable' in meminfo:
+                        break
         
         total_gb = round(meminfo.get('MemTotal', 0) / (1024**3))
         available_gb = round(meminfo.get('MemAvailable', meminfo.get('MemFree', 0)) / (1024**3))
@@ -352,9 +404,59 @@ def _get_disk_free_space(path):
     except:
         return 10  # Fallback value
 
-def _show_host_setup_welcome(ui) -> bool:
-    """Show welcome message and overview for host setup."""
-    welcome_text = """
+# PCI vendor IDs as reported in /sys/class/drm/card*/device/vendor
+_GPU_VENDOR_IDS = {'0x10de': 'nvidia', '0x1002': 'amd', '0x8086': 'intel'}
+
+def _read_drm_gpu_vendors():
+    """Return GPU vendors found via sysfs DRM cards, or None if sysfs has no cards."""
+    import glob
+    
+    vendor_files = glob.glob('/sys/class/drm/card*/device/vendor')
+    if not vendor_files:
+        return None
+    
+    vendors = set()
+    for path in vendor_files:
+        try:
+            with open(path, 'r') as f:
+                vendor = _GPU_VENDOR_IDS.get(f.read().strip())
+        except OSError:
+            continue
+        if vendor:
+            vendors.add(vendor)
+    return vendors
+
+def _read_nvidia_proc_gpus():
+    """Return NVIDIA GPU model names from /proc/driver/nvidia, or None if the driver is not loaded."""
+    import glob
+    
+    if not os.path.isdir('/proc/driver/nvidia'):
+        return None
+    
+    devices = []
+    for path in sorted(glob.glob('/proc/driver/nvidia/gpus/*/information')):
+        try:
+            with open(path, 'r') as f:
+                for line in f:
+                    key, _, value = line.partition(':')
+                    if key.strip() == 'Model':
+                        devices.append(value.strip())
+                        break
+        except OSError:
+            continue
+    return devices
+
+def _run_probe(cmd, timeout=None):
+    """Run a host probe command, returning None if it cannot be executed or times out."""
+    import subprocess
+    try:
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+
+# Static text for the host setup screens, built once at import rather than on
+# every call. Only the system-specific lines are formatted per run.
+_HOST_SETUP_WELCOME_TEXT = """
 [bold blue]Weirding Host Setup Utility[/bold blue]
 
 Optimize your system to work seamlessly with Weirding Modules.
@@ -375,11 +477,73 @@ Optimize your system to work seamlessly with Weirding Modules.
 
 [red]⚠️  System Modifications Required ⚠️[/red]
 This process will install packages and modify system configuration.
+"""
+
+_HOST_SETUP_CHANGES = {
+    'basic': (
+        "Install Docker container runtime",
+        "Configure automatic USB device mounting",
+        "Install Python development tools",
+        "Set up system service for Weirding detection"
+    ),
+    'standard': (
+        "All Basic optimizations",
+        "Install performance monitoring tools",
+        "Configure CPU governor for performance",
+        "Set up memory optimization",
+        "Install additional development tools"
+    ),
+    'full': (
+        "All Standard optimizations",
+        "Install NVIDIA Container Toolkit (if NVIDIA GPU)",
+        "Install AMD ROCm support (if AMD GPU)",
+        "Configure GPU acceleration for containers",
+        "Install ML development libraries",
+        "Set up GPU monitoring and optimization"
+    )
+}
+
+_HOST_SETUP_SUMMARY_FOOTER = """
+[bold]Estimated time:[/bold] 5-15 minutes
+[bold]Disk space required:[/bold] ~2-5 GB
+[bold]Network connection:[/bold] Required for package downloads
+
+[green]After completion, your system will be optimized for Weirding Modules![/green]
     """
-    
+
+_HOST_SETUP_COMPLETION_HEADER = """
+[bold green]🎉 Host Setup Complete![/bold green]
+
+[bold]Your system is now optimized for Weirding Modules:[/bold]
+
+[green]✅ What's been configured:[/green]
+• Docker container runtime with automatic startup
+• USB device mounting for external drives
+• Essential development tools and dependencies
+• System services for Weirding Module detection
+"""
+
+_HOST_SETUP_NEXT_STEPS = """
+
+[bold yellow]Next Steps:[/bold yellow]
+1. Connect a Weirding Module via USB
+2. The system will now auto-detect and optimize performance
+3. Use 'python main.py setup-module' to create new modules
+4. Modules will automatically leverage your hardware capabilities
+
+[bold cyan]Testing:[/bold cyan]
+• Run 'docker --version' to verify container support
+• Check 'python main.py list-drives' for drive detection
+• Your system is ready for portable AI computing!
+
+[green]Welcome to the Weirding ecosystem! 🚀[/green]
+    """
+
+def _show_host_setup_welcome(ui) -> bool:
+    """Show welcome message and overview for host setup."""
     from rich.panel import Panel
     panel = Panel(
-        welcome_text,
+        _HOST_SETUP_WELCOME_TEXT,
         title="🖥️ Host System Optimization",
         border_style="blue",
         padding=(1, 2)
@@ -393,9 +557,10 @@ This process will install packages and modify system configuration.
 
 def _analyze_host_system(ui):
     """Analyze the host system capabilities and configuration."""
-    import subprocess
     import shutil
-    from pathlib import Path
+    from concurrent.futures import ThreadPoolExecutor
+    
+    memory_info = _get_memory_info()
     
     system_info = {
         'cpu': {
@@ -404,8 +569,8 @@ def _analyze_host_system(ui):
             'model': 'Unknown'
         },
         'memory': {
-            'total_gb': _get_memory_info()['total_gb'],
-            'available_gb': _get_memory_info()['available_gb']
+            'total_gb': memory_info['total_gb'],
+            'available_gb': memory_info['available_gb']
         },
         'gpu': {
             'nvidia': False,
@@ -430,60 +595,65 @@ def _analyze_host_system(ui):
     
     # Get CPU model
     try:
-        with open('/proc/cpuinfo', 'r') as f:
-            for line in f:
-                if line.startswith('model name'):
-                    system_info['cpu']['model'] = line.split(':')[1].strip()
-                    break
+        system_info['cpu']['model'] = _read_cpuinfo()[1] or 'Unknown'
     except:
         pass
     
-    # Check for GPU
-    try:
-        # Check for NVIDIA GPU
-        result = subprocess.run(['nvidia-smi', '--list-gpus'],
-                              capture_output=True, text=True)
-        if result.returncode == 0:
+    # Check packages
+    system_info['containers']['docker_installed'] = shutil.which('docker') is not None
+    for package in ['python3', 'git', 'curl']:
+        system_info['packages'][package] = shutil.which(package) is not None
+    
+    # Run the independent subprocess probes concurrently
+    # GPU detection prefers the kernel's own view in /proc and sysfs and only
+    # falls back to forking nvidia-smi/lspci when those are unavailable
+    nvidia_devices = _read_nvidia_proc_gpus()
+    drm_vendors = _read_drm_gpu_vendors()
+    
+    probes = {}
+    if nvidia_devices is None:
+        # A hung driver must not stall setup-host, so bound this probe
+        probes['nvidia'] = (['nvidia-smi', '--query-gpu=name', '--format=csv,noheader'], 2)
+    if drm_vendors is None:
+        probes['lspci'] = (['lspci'],)
+    if system_info['containers']['docker_installed']:
+        probes['docker'] = (['systemctl', 'is-active', 'docker'],)
+    
+    results = {}
+    if probes:
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            futures = {name: executor.submit(_run_probe, *args) for name, args in probes.items()}
+            results = {name: future.result() for name, future in futures.items()}
+    
+    # Check for NVIDIA GPU
+    if nvidia_devices is not None:
+        system_info['gpu']['nvidia'] = True
+        system_info['gpu']['devices'].extend(nvidia_devices)
+    else:
+        result = results['nvidia']
+        if result and result.returncode == 0:
             system_info['gpu']['nvidia'] = True
-            system_info['gpu']['devices'].extend(result.stdout.strip().split('\n'))
-    except:
-        pass
-    
-    try:
-        # Check for AMD GPU
-        result = subprocess.run(['lspci'], capture_output=True, text=True)
-        if 'AMD' in result.stdout and ('VGA' in result.stdout or 'Display' in result.stdout):
-            system_info['gpu']['amd'] = True
-    except:
-        pass
-    
-    try:
-        # Check for Intel GPU
-        result = subprocess.run(['lspci'], capture_output=True, text=True)
-        if 'Intel' in result.stdout and ('VGA' in result.stdout or 'Display' in result.stdout):
-            system_info['gpu']['intel'] = True
-    except:
-        pass
+            system_info['gpu']['devices'].extend(
+                name.strip() for name in result.stdout.splitlines() if name.strip()
+            )
+    
+    # Check for AMD and Intel GPUs
+    if drm_vendors is not None:
+        system_info['gpu']['nvidia'] = system_info['gpu']['nvidia'] or 'nvidia' in drm_vendors
+        system_info['gpu']['amd'] = 'amd' in drm_vendors
+        system_info['gpu']['intel'] = 'intel' in drm_vendors
+    else:
+        result = results['lspci']
+        if result:
+            lspci_out = result.stdout
+            has_display = 'VGA' in lspci_out or 'Display' in lspci_out
+            system_info['gpu']['amd'] = has_display and 'AMD' in lspci_out
+            system_info['gpu']['intel'] = has_display and 'Intel' in lspci_out
     
     # Check Docker
-    try:
-        result = subprocess.run(['which', 'docker'], capture_output=True, text=True)
-        system_info['containers']['docker_installed'] = result.returncode == 0
-        
-        if system_info['containers']['docker_installed']:
-            result = subprocess.run(['systemctl', 'is-active', 'docker'],
-                                  capture_output=True, text=True)
-            system_info['containers']['docker_running'] = result.stdout.strip() == 'active'
-    except:
-        pass
-    
-    # Check packages
-    for package in ['python3', 'git', 'curl']:
-        try:
-            result = subprocess.run(['which', package], capture_output=True, text=True)
-            system_info['packages'][package] = result.returncode == 0
-        except:
-            pass
+    result = results.get('docker')
+    if result:
+        system_info['containers']['docker_running'] = result.stdout.strip() == 'active'
     
     # Determine optimization potential
     if system_info['gpu']['nvidia'] or system_info['gpu']['amd']:
@@ -581,31 +751,6 @@ def _confirm_host_setup(ui, system_info, optimization_level):
     from rich.panel import Panel
     from rich.prompt import Confirm
     
-    # Define what will be installed/configured
-    changes = {
-        'basic': [
-            "Install Docker container runtime",
-            "Configure automatic USB device mounting",
-            "Install Python development tools",
-            "Set up system service for Weirding detection"
-        ],
-        'standard': [
-            "All Basic optimizations",
-            "Install performance monitoring tools",
-            "Configure CPU governor for performance",
-            "Set up memory optimization",
-            "Install additional development tools"
-        ],
-        'full': [
-            "All Standard optimizations",
-            "Install NVIDIA Container Toolkit (if NVIDIA GPU)",
-            "Install AMD ROCm support (if AMD GPU)",
-            "Configure GPU acceleration for containers",
-            "Install ML development libraries",
-            "Set up GPU monitoring and optimization"
-        ]
-    }
-    
     summary_text = f"""
 [bold blue]Host Setup Summary[/bold blue]
 
@@ -617,16 +762,10 @@ def _confirm_host_setup(ui, system_info, optimization_level):
 [yellow]Changes to be made:[/yellow]
 """
     
-    for change in changes.get(optimization_level, changes['basic']):
+    for change in _HOST_SETUP_CHANGES.get(optimization_level, _HOST_SETUP_CHANGES['basic']):
         summary_text += f"• {change}\n"
     
-    summary_text += f"""
-[bold]Estimated time:[/bold] 5-15 minutes
-[bold]Disk space required:[/bold] ~2-5 GB
-[bold]Network connection:[/bold] Required for package downloads
-
-[green]After completion, your system will be optimized for Weirding Modules![/green]
-    """
+    summary_text += _HOST_SETUP_SUMMARY_FOOTER
     
     panel = Panel(
         summary_text.strip(),
@@ -669,35 +808,37 @@ def _execute_host_setup(ui, system_info, optimization_level):
                              f"Failed to update package lists (exit code {e.returncode}): {e.stderr.strip() if e.stderr else 'Unknown error'}")
                 return False
         
-        # Step 2: Install Docker if not present
-        if not system_info['containers']['docker_installed']:
-            progress.update(task, description="Installing Docker...")
+        # Step 2: Install essential packages, plus Docker if not present, in one transaction
+        packages = ['python3-pip', 'git', 'curl', 'wget', 'unzip', 'jq']
+        install_docker = not system_info['containers']['docker_installed']
+        if install_docker:
+            packages = ['docker.io', 'docker-compose'] + packages
+            progress.update(task, description="Installing Docker and essential packages...")
+        else:
+            progress.update(task, description="Installing essential packages...")
+        try:
+            subprocess.run(['apt-get', 'install', '-y', '--no-install-recommends'] + packages,
+                           capture_output=True, text=True, check=True,
+                           env={**os.environ, 'DEBIAN_FRONTEND': 'noninteractive'})
+            progress.update(task, completed=50)
+        except subprocess.CalledProcessError as e:
+            ui.show_error("Package Installation Failed",
+                         f"Failed to install packages (exit code {e.returncode}): {e.stderr.strip() if e.stderr else 'Unknown error'}")
+            return False
+        
+        # Step 3: Enable and start Docker once it is installed
+        if install_docker:
+            progress.update(task, description="Starting Docker...")
             try:
-                result = subprocess.run(['apt-get', 'install', '-y', 'docker.io', 'docker-compose'],
-                                     capture_output=True, text=True, check=True)
                 subprocess.run(['systemctl', 'enable', 'docker'],
                              capture_output=True, text=True, check=True)
                 subprocess.run(['systemctl', 'start', 'docker'],
                              capture_output=True, text=True, check=True)
-                progress.update(task, completed=50)
             except subprocess.CalledProcessError as e:
                 ui.show_error("Docker Installation Failed",
-                             f"Failed to install Docker (exit code {e.returncode}): {e.stderr.strip() if e.stderr else 'Unknown error'}")
+                             f"Failed to start Docker (exit code {e.returncode}): {e.stderr.strip() if e.stderr else 'Unknown error'}")
                 return False
-        else:
-            progress.update(task, completed=50)
-        
-        # Step 3: Install essential packages
-        progress.update(task, description="Installing essential packages...")
-        essential_packages = ['python3-pip', 'git', 'curl', 'wget', 'unzip', 'jq']
-        try:
-            result = subprocess.run(['apt-get', 'install', '-y'] + essential_packages,
-                                 capture_output=True, text=True, check=True)
-            progress.update(task, completed=75)
-        except subprocess.CalledProcessError as e:
-            ui.show_error("Package Installation Failed",
-                         f"Failed to install essential packages (exit code {e.returncode}): {e.stderr.strip() if e.stderr else 'Unknown error'}")
-            return False
+        progress.update(task, completed=75)
         
         # Step 4: GPU-specific setup for full optimization
         if optimization_level == 'full':
@@ -720,17 +861,7 @@ def _show_host_setup_completion(ui, system_info, optimization_level):
     """Show completion summary and next steps."""
     from rich.panel import Panel
     
-    completion_text = f"""
-[bold green]🎉 Host Setup Complete![/bold green]
-
-[bold]Your system is now optimized for Weirding Modules:[/bold]
-
-[green]✅ What's been configured:[/green]
-• Docker container runtime with automatic startup
-• USB device mounting for external drives
-• Essential development tools and dependencies
-• System services for Weirding Module detection
-"""
+    completion_text = _HOST_SETUP_COMPLETION_HEADER
     
     if optimization_level in ['standard', 'full']:
         completion_text += """• Performance optimizations for AI workloads
@@ -741,21 +872,7 @@ def _show_host_setup_completion(ui, system_info, optimization_level):
 • GPU acceleration support for AI models
 • Container GPU passthrough capabilities"""
     
-    completion_text += f"""
-
-[bold yellow]Next Steps:[/bold yellow]
-1. Connect a Weirding Module via USB
-2. The system will now auto-detect and optimize performance
-3. Use 'python main.py setup-module' to create new modules
-4. Modules will automatically leverage your hardware capabilities
-
-[bold cyan]Testing:[/bold cyan]
-• Run 'docker --version' to verify container support
-• Check 'python main.py list-drives' for drive detection
-• Your system is ready for portable AI computing!
-
-[green]Welcome to the Weirding ecosystem! 🚀[/green]
-    """
+    completion_text += _HOST_SETUP_NEXT_STEPS
     
     panel = Panel(
         completion_text.strip(),
@@ -7,16 +7,64 @@ that can be used as the foundation for Weirding Modules.
 """
 
 import hashlib
+import http.client
+import urllib.parse
 import urllib.request
-import socket
 from pathlib import Path
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, asdict
+from collections import defaultdict
 import json
+import mmap
 import os
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+# Read size for image downloads; large reads keep the per-chunk overhead of
+# the socket, file write and hash update negligible next to the transfer.
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
-@dataclass
+# Upper bound on simultaneous downloads in download_images
+MAX_PARALLEL_DOWNLOADS = 4
+
+# File in the cache directory recording SHA256 digests of cached images,
+# keyed by path and validated against each file's size and mtime
+VERIFY_CACHE_FILENAME = "verify.json"
+
+# File in the cache directory holding the last built catalog, reused for
+# CATALOG_CACHE_TTL seconds as long as the set of cached ISOs is unchanged
+CATALOG_CACHE_FILENAME = "catalog.json"
+CATALOG_CACHE_TTL = 24 * 60 * 60
+
+# Ubuntu LTS releases offered when building the catalog from live release pages
+UBUNTU_RELEASES = ("24.04", "22.04")
+UBUNTU_RELEASES_URL = "https://releases.ubuntu.com"
+
+# Seconds to wait on a stalled connection before giving up on a request
+HTTP_TIMEOUT = 10
+
+# Statuses that _fetch_release hands to urllib to follow
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+# ISO links on a releases.ubuntu.com version index page
+_ISO_LINK_RE = re.compile(rb'href="(ubuntu-[\d\.]+-(?:desktop|live-server)-amd64\.iso)"')
+
+# "<sha256>  [*]<filename>.iso" lines in a SHA256SUMS file
+_SHA256SUMS_LINE_RE = re.compile(rb'^([0-9a-fA-F]{64})\s+\*?(\S+\.iso)\s*$', re.M)
+
+# GPU vendors supported by every image in the catalog, shared by all entries
+_GPU_ALL = ("intel", "amd", "nvidia")
+
+# Use cases per image kind, shared by all entries of that kind
+_DESKTOP_USES = ("desktop", "development", "ai_workloads")
+_SERVER_USES = ("server", "ai_workloads", "gpu_computing")
+_MINIMAL_USES = ("general", "lightweight", "servers")
+
+
+@dataclass(slots=True, frozen=True)
 class BaseImage:
     """Information about a base operating system image."""
     id: str
@@ -27,49 +75,155 @@ class BaseImage:
     size_mb: int
     download_url: str
     sha256_hash: str
-    recommended_for: List[str]
+    recommended_for: Tuple[str, ...]
     ai_optimized: bool
     container_ready: bool
-    gpu_support: List[str]
+    gpu_support: Tuple[str, ...]
 
 
 class BaseImageCatalog:
     """Manages the catalog of available base images for Weirding Modules."""
     
     def __init__(self):
+        # Created on first write; every read path tolerates it being absent
         self.cache_dir = Path.home() / ".weirding_cache" / "images"
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.catalog = self._initialize_catalog()
+        self._verify_cache = None
+        # Guards _verify_cache and its file; download_images verifies on several threads
+        self._verify_lock = threading.Lock()
+        self._catalog: Optional[List[BaseImage]] = None
+    
+    @property
+    def catalog(self) -> List[BaseImage]:
+        """Available images, built on first access rather than at construction."""
+        return self._ensure_catalog()
+    
+    def _ensure_catalog(self) -> List[BaseImage]:
+        """Build the catalog and its indexes if that has not happened yet."""
+        if self._catalog is None:
+            self._set_catalog(self._initialize_catalog())
+        return self._catalog
+    
+    def _set_catalog(self, images: List[BaseImage]):
+        """Install a catalog and build the lookup indexes used by the getters."""
+        self._catalog = images
+        self._by_id = {img.id: img for img in images}
+        self._by_use_case = defaultdict(list)
+        for img in images:
+            for use_case in img.recommended_for:
+                self._by_use_case[use_case].append(img)
+        self._ai_optimized = [img for img in images if img.ai_optimized]
+    
+    def refresh_live(self) -> List[BaseImage]:
+        """Re-query the live release APIs, keeping the current catalog if they fail."""
+        live_catalog = self._query_ubuntu_releases()
+        if live_catalog:
+            self._set_catalog(live_catalog)
+            self._save_catalog_file(live_catalog, self._iso_fingerprint())
+        return self.catalog
     
     def _initialize_catalog(self) -> List[BaseImage]:
         """Initialize the catalog with available base images."""
+        # Reuse the catalog saved by a previous run while the cached ISOs are unchanged
+        fingerprint = self._iso_fingerprint()
+        catalog = self._load_catalog_file(fingerprint)
+        if catalog is not None:
+            return catalog
+        
         # Start with cached images
         catalog = self._build_cached_catalog()
         
         # If no cached images, build from live APIs
         if not catalog:
-            catalog = self._build_live_catalog()
+            catalog = self._query_ubuntu_releases()
+        
+        if catalog:
+            self._save_catalog_file(catalog, fingerprint)
+        else:
+            # Not saved, so the live APIs are retried on the next run
+            catalog = self._get_fallback_catalog()
         
         return catalog
     
+    def _iso_fingerprint(self) -> List[List]:
+        """Name, size and mtime of every cached ISO, used to validate the saved catalog."""
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                fingerprint = []
+                for entry in entries:
+                    if entry.name.endswith(".iso") and entry.is_file(follow_symlinks=False):
+                        stat = entry.stat()
+                        fingerprint.append([entry.name, stat.st_size, stat.st_mtime_ns])
+        except FileNotFoundError:
+            return []
+        return sorted(fingerprint)
+    
+    def _load_catalog_file(self, fingerprint: List[List]) -> Optional[List[BaseImage]]:
+        """Load the saved catalog if it is fresh and matches the cached ISOs."""
+        catalog_file = self.cache_dir / CATALOG_CACHE_FILENAME
+        try:
+            if time.time() - catalog_file.stat().st_mtime >= CATALOG_CACHE_TTL:
+                return None
+            with open(catalog_file, 'r') as f:
+                data = json.load(f)
+            if data['isos'] != fingerprint:
+                return None
+            return [
+                BaseImage(**dict(fields, recommended_for=tuple(fields['recommended_for']),
+                                 gpu_support=tuple(fields['gpu_support'])))
+                for fields in data['images']
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _save_catalog_file(self, catalog: List[BaseImage], fingerprint: List[List]):
+        """Persist the built catalog for later runs."""
+        self._write_json_atomic(self.cache_dir / CATALOG_CACHE_FILENAME, {
+            'isos': fingerprint,
+            'images': [asdict(image) for image in catalog]
+        })
+    
+    def _write_json_atomic(self, path: Path, data):
+        """Write JSON via a temp file and rename so readers never see a partial file."""
+        tmp_file = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique temp name, so concurrent writers never truncate each other's file
+            fd, tmp_file = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, path)
+        except OSError:
+            # These caches are only an optimization
+            if tmp_file is not None:
+                try:
+                    os.unlink(tmp_file)
+                except OSError:
+                    pass
+    
     def _build_cached_catalog(self) -> List[BaseImage]:
         """Build catalog from cached ISO files."""
         catalog = []
         
-        if not self.cache_dir.exists():
+        try:
+            entries = os.scandir(self.cache_dir)
+        except FileNotFoundError:
             return catalog
         
-        for iso_file in self.cache_dir.glob("*.iso"):
-            # Try to extract image info from filename
-            image = self._parse_cached_iso(iso_file)
-            if image:
-                catalog.append(image)
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(".iso") or not entry.is_file(follow_symlinks=False):
+                    continue
+                # Try to extract image info from filename, reusing the scandir stat
+                image = self._parse_cached_iso(Path(entry.path), entry.stat())
+                if image:
+                    catalog.append(image)
         
         return catalog
     
-    def _parse_cached_iso(self, iso_path: Path) -> Optional[BaseImage]:
+    def _parse_cached_iso(self, iso_path: Path, stat: Optional[os.stat_result] = None) -> Optional[BaseImage]:
         """Parse cached ISO file to create BaseImage."""
         filename = iso_path.name
+        size_mb = int((stat or iso_path.stat()).st_size // (1024 * 1024))
         
         # Ubuntu patterns
         if "ubuntu" in filename.lower():
@@ -80,13 +234,13 @@ class BaseImageCatalog:
                     description="Ubuntu 24.04 LTS Desktop (Cached)",
                     version="24.04.2",
                     architecture="amd64",
-                    size_mb=int(iso_path.stat().st_size // (1024 * 1024)),
+                    size_mb=size_mb,
                     download_url="",  # Already cached
                     sha256_hash="",   # Will verify when used
-                    recommended_for=["desktop", "development", "ai_workloads"],
+                    recommended_for=_DESKTOP_USES,
                     ai_optimized=True,
                     container_ready=True,
-                    gpu_support=["intel", "amd", "nvidia"]
+                    gpu_support=_GPU_ALL
                 )
             elif "22.04" in filename:
                 return BaseImage(
@@ -95,13 +249,13 @@ class BaseImageCatalog:
                     description="Ubuntu 22.04 LTS Server (Cached)",
                     version="22.04",
                     architecture="amd64",
-                    size_mb=int(iso_path.stat().st_size // (1024 * 1024)),
+                    size_mb=size_mb,
                     download_url="",
                     sha256_hash="",
-                    recommended_for=["server", "ai_workloads", "gpu_computing"],
+                    recommended_for=_SERVER_USES,
                     ai_optimized=True,
                     container_ready=True,
-                    gpu_support=["intel", "amd", "nvidia"]
+                    gpu_support=_GPU_ALL
                 )
         
         # Debian patterns
@@ -112,76 +266,113 @@ class BaseImageCatalog:
                 description="Debian 12 (Bookworm) - Cached",
                 version="12",
                 architecture="amd64",
-                size_mb=int(iso_path.stat().st_size // (1024 * 1024)),
+                size_mb=size_mb,
                 download_url="",
                 sha256_hash="",
-                recommended_for=["general", "lightweight", "servers"],
+                recommended_for=_MINIMAL_USES,
                 ai_optimized=False,
                 container_ready=True,
-                gpu_support=["intel", "amd", "nvidia"]
+                gpu_support=_GPU_ALL
             )
         
         return None
     
-    def _build_live_catalog(self) -> List[BaseImage]:
-        """Build catalog by querying live Ubuntu/Debian APIs."""
-        catalog = []
-        
-        # Add Ubuntu releases
-        catalog.extend(self._query_ubuntu_releases())
-        
-        # Add fallback minimal set if API fails
-        if not catalog:
-            catalog = self._get_fallback_catalog()
-        
-        return catalog
-    
     def _query_ubuntu_releases(self) -> List[BaseImage]:
         """Query Ubuntu release API for current ISOs."""
         catalog = []
         
         try:
-            # Query Ubuntu 24.04 LTS
-            ubuntu_24_images = self._get_ubuntu_release_info("24.04")
-            catalog.extend(ubuntu_24_images)
-            
-            # Query Ubuntu 22.04 LTS
-            ubuntu_22_images = self._get_ubuntu_release_info("22.04")
-            catalog.extend(ubuntu_22_images)
+            # Fetch each release concurrently; the requests are independent and
+            # dominated by network latency
+            with ThreadPoolExecutor(max_workers=len(UBUNTU_RELEASES)) as executor:
+                fetches = {
+                    version: executor.submit(self._fetch_release, version)
+                    for version in UBUNTU_RELEASES
+                }
+                
+                for version, future in fetches.items():
+                    try:
+                        content, sha_content = future.result()
+                    except Exception as e:
+                        print(f"Warning: Could not fetch Ubuntu {version} release info: {e}")
+                        continue
+                    catalog.extend(self._parse_ubuntu_release(version, content, sha_content))
             
         except Exception as e:
             print(f"Warning: Could not query Ubuntu APIs: {e}")
         
         return catalog
     
-    def _get_ubuntu_release_info(self, version: str) -> List[BaseImage]:
-        """Get Ubuntu release information for a specific version."""
-        images = []
+    def _fetch_release(self, version: str) -> Tuple[bytes, bytes]:
+        """
+        Fetch an Ubuntu version's index page and SHA256SUMS over one connection.
+        
+        Both files live on the same host, so the second request reuses the
+        kept-alive connection instead of paying for another TLS handshake.
+        
+        Returns:
+            Tuple of (index_page, sha256sums); sha256sums is empty if unavailable
+        """
+        url = urllib.parse.urlsplit(UBUNTU_RELEASES_URL)
+        # urllib handles proxies (HTTPS_PROXY, no_proxy) the same way downloads do
+        if urllib.request.getproxies().get('https') and not urllib.request.proxy_bypass(url.hostname):
+            return self._fetch_release_urllib(version)
         
+        connection = http.client.HTTPSConnection(url.netloc, timeout=HTTP_TIMEOUT)
         try:
-            # Fetch Ubuntu release page
-            url = f"https://releases.ubuntu.com/{version}/"
-            with urllib.request.urlopen(url) as response:
-                content = response.read().decode('utf-8')
+            connection.request("GET", f"{url.path}/{version}/")
+            response = connection.getresponse()
+            content = response.read()
+            if response.status in _REDIRECT_STATUSES:
+                # Let urllib follow the redirect, wherever it leads
+                return self._fetch_release_urllib(version)
+            if response.status != 200:
+                raise RuntimeError(f"HTTP {response.status} {response.reason}")
+            
+            try:
+                connection.request("GET", f"{url.path}/{version}/SHA256SUMS")
+                response = connection.getresponse()
+                sha_content = response.read() if response.status == 200 else b""
+            except (OSError, http.client.HTTPException):
+                sha_content = b""
             
+            return content, sha_content
+        finally:
+            connection.close()
+    
+    def _fetch_release_urllib(self, version: str) -> Tuple[bytes, bytes]:
+        """
+        Fetch an Ubuntu version's index page and SHA256SUMS through urllib, for
+        proxied networks and redirected release pages.
+        
+        Returns:
+            Tuple of (index_page, sha256sums); sha256sums is empty if unavailable
+        """
+        release_url = f"{UBUNTU_RELEASES_URL}/{version}/"
+        with urllib.request.urlopen(release_url, timeout=HTTP_TIMEOUT) as response:
+            content = response.read()
+        
+        try:
+            with urllib.request.urlopen(release_url + "SHA256SUMS", timeout=HTTP_TIMEOUT) as response:
+                sha_content = response.read()
+        except (OSError, http.client.HTTPException):
+            sha_content = b""
+        
+        return content, sha_content
+    
+    def _parse_ubuntu_release(self, version: str, content: bytes, sha_content: bytes) -> List[BaseImage]:
+        """Build BaseImages for an Ubuntu version from its index page and SHA256SUMS."""
+        images = []
+        
+        try:
             # Parse for desktop and server ISOs
-            import re
-            iso_pattern = r'href="(ubuntu-[\d\.]+-(?:desktop|live-server)-amd64\.iso)"'
-            matches = re.findall(iso_pattern, content)
+            matches = [m.group(1).decode('ascii') for m in _ISO_LINK_RE.finditer(content)]
             
             # Get SHA256 hashes
-            sha_url = f"https://releases.ubuntu.com/{version}/SHA256SUMS"
-            sha_hashes = {}
-            try:
-                with urllib.request.urlopen(sha_url) as response:
-                    sha_content = response.read().decode('utf-8')
-                for line in sha_content.split('\n'):
-                    if '.iso' in line:
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            sha_hashes[parts[1].replace('*', '')] = parts[0]
-            except:
-                pass
+            sha_hashes = {
+                m.group(2).decode('ascii'): m.group(1).decode('ascii')
+                for m in _SHA256SUMS_LINE_RE.finditer(sha_content)
+            }
             
             for iso_filename in matches:
                 if "desktop" in iso_filename:
@@ -192,12 +383,12 @@ class BaseImageCatalog:
                         version=version,
                         architecture="amd64",
                         size_mb=5900,  # Approximate size
-                        download_url=f"https://releases.ubuntu.com/{version}/{iso_filename}",
+                        download_url=f"{UBUNTU_RELEASES_URL}/{version}/{iso_filename}",
                         sha256_hash=sha_hashes.get(iso_filename, ""),
-                        recommended_for=["desktop", "development", "ai_workloads"],
+                        recommended_for=_DESKTOP_USES,
                         ai_optimized=True,
                         container_ready=True,
-                        gpu_support=["intel", "amd", "nvidia"]
+                        gpu_support=_GPU_ALL
                     ))
                 elif "server" in iso_filename:
                     images.append(BaseImage(
@@ -207,16 +398,16 @@ class BaseImageCatalog:
                         version=version,
                         architecture="amd64",
                         size_mb=3000,  # Approximate size
-                        download_url=f"https://releases.ubuntu.com/{version}/{iso_filename}",
+                        download_url=f"{UBUNTU_RELEASES_URL}/{version}/{iso_filename}",
                         sha256_hash=sha_hashes.get(iso_filename, ""),
-                        recommended_for=["server", "ai_workloads", "gpu_computing"],
+                        recommended_for=_SERVER_USES,
                         ai_optimized=True,
                         container_ready=True,
-                        gpu_support=["intel", "amd", "nvidia"]
+                        gpu_support=_GPU_ALL
                     ))
                         
         except Exception as e:
-            print(f"Warning: Could not fetch Ubuntu {version} release info: {e}")
+            print(f"Warning: Could not parse Ubuntu {version} release info: {e}")
         
         return images
     
@@ -232,10 +423,10 @@ class BaseImageCatalog:
                 size_mb=5900,
                 download_url="https://releases.ubuntu.com/24.04/ubuntu-24.04.2-desktop-amd64.iso",
                 sha256_hash="d7fe3d6a0419667d2f8eff12796996328daa2d4f90cd9f87aa9371b362f987bf",
-                recommended_for=["desktop", "development", "ai_workloads"],
+                recommended_for=_DESKTOP_USES,
                 ai_optimized=True,
                 container_ready=True,
-                gpu_support=["intel", "amd", "nvidia"]
+                gpu_support=_GPU_ALL
             ),
             BaseImage(
                 id="ubuntu-2404-server",
@@ -246,10 +437,10 @@ class BaseImageCatalog:
                 size_mb=3000,
                 download_url="https://releases.ubuntu.com/24.04/ubuntu-24.04.2-live-server-amd64.iso",
                 sha256_hash="d6dab0c3a657988501b4bd76f1297c053df710e06e0c3aece60dead24f270b4d",
-                recommended_for=["server", "ai_workloads", "gpu_computing"],
+                recommended_for=_SERVER_USES,
                 ai_optimized=True,
                 container_ready=True,
-                gpu_support=["intel", "amd", "nvidia"]
+                gpu_support=_GPU_ALL
             )
         ]
     
@@ -259,30 +450,26 @@ class BaseImageCatalog:
     
     def get_image_by_id(self, image_id: str) -> Optional[BaseImage]:
         """Get a specific image by ID."""
-        for image in self.catalog:
-            if image.id == image_id:
-                return image
-        return None
+        self._ensure_catalog()
+        return self._by_id.get(image_id)
     
     def get_recommended_images(self, use_case: str = None) -> List[BaseImage]:
         """Get images recommended for a specific use case."""
         if not use_case:
             return self.catalog
         
-        return [img for img in self.catalog if use_case in img.recommended_for]
+        self._ensure_catalog()
+        return list(self._by_use_case.get(use_case, ()))
     
     def get_ai_optimized_images(self) -> List[BaseImage]:
         """Get images that are pre-optimized for AI workloads."""
-        return [img for img in self.catalog if img.ai_optimized]
+        self._ensure_catalog()
+        return list(self._ai_optimized)
     
     def is_image_cached(self, image: BaseImage) -> bool:
         """Check if an image is already downloaded and cached."""
-        cache_path = self.cache_dir / f"{image.id}.iso"
-        if not cache_path.exists():
-            return False
-        
-        # Verify file integrity
-        return self._verify_image_integrity(cache_path, image.sha256_hash)
+        # A missing file fails the stat inside the integrity check
+        return self._verify_image_integrity(self.cache_dir / f"{image.id}.iso", image.sha256_hash)
     
     def get_cached_image_path(self, image: BaseImage) -> Optional[Path]:
         """Get the path to a cached image if available."""
@@ -312,28 +499,16 @@ class BaseImageCatalog:
         if progress_callback:
             progress_callback(f"Downloading {image.name} ({image.size_mb}MB)...")
         
-        # Download the image
+        # Download the image, hashing each chunk as it is written so the
+        # integrity check needs no second pass over the file
         try:
-            with urllib.request.urlopen(image.download_url) as response:
-                total_size = int(response.headers.get('Content-Length', 0))
-                downloaded = 0
-                
-                with open(cache_path, 'wb') as f:
-                    while True:
-                        chunk = response.read(8192)
-                        if not chunk:
-                            break
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        
-                        if progress_callback and total_size > 0:
-                            percent = (downloaded / total_size) * 100
-                            progress_callback(f"Downloading {image.name}: {percent:.1f}%")
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            digest = self._stream_to_file(image, cache_path, progress_callback)
             
-            # Verify integrity
-            if not self._verify_image_integrity(cache_path, image.sha256_hash):
+            if digest != image.sha256_hash.lower():
                 cache_path.unlink()
                 raise RuntimeError(f"Downloaded image failed integrity check: {image.name}")
+            self._remember_digest(cache_path, digest)
             
             if progress_callback:
                 progress_callback(f"Successfully downloaded and verified: {image.name}")
@@ -345,19 +520,115 @@ class BaseImageCatalog:
                 cache_path.unlink()
             raise RuntimeError(f"Failed to download {image.name}: {str(e)}")
     
+    def download_images(self, images: List[BaseImage], progress_callback=None) -> Dict[str, Path]:
+        """
+        Download several images concurrently.
+        
+        Args:
+            images: BaseImages to download
+            progress_callback: Optional callback for download progress
+            
+        Returns:
+            Mapping of image ID to downloaded image path
+        """
+        if not images:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(len(images), MAX_PARALLEL_DOWNLOADS)) as executor:
+            futures = {
+                image.id: executor.submit(self.download_image, image, progress_callback)
+                for image in images
+            }
+            return {image_id: future.result() for image_id, future in futures.items()}
+    
+    def _stream_to_file(self, image: BaseImage, cache_path: Path, progress_callback=None) -> str:
+        """Stream an image download to disk, returning the SHA256 of the bytes written."""
+        sha256_hash = hashlib.sha256()
+        # One reusable buffer for the whole transfer instead of a new bytes
+        # object per chunk
+        buffer = bytearray(DOWNLOAD_CHUNK_SIZE)
+        view = memoryview(buffer)
+        
+        with urllib.request.urlopen(image.download_url, timeout=HTTP_TIMEOUT) as response:
+            total_size = int(response.headers.get('Content-Length', 0))
+            downloaded = 0
+            last_percent = -1
+            
+            with open(cache_path, 'wb') as f:
+                while True:
+                    count = response.readinto(buffer)
+                    if not count:
+                        break
+                    chunk = view[:count]
+                    f.write(chunk)
+                    sha256_hash.update(chunk)
+                    downloaded += count
+                    
+                    if progress_callback and total_size > 0:
+                        # Only report whole-percent steps, not every chunk
+                        percent = downloaded * 100 // total_size
+                        if percent != last_percent:
+                            last_percent = percent
+                            progress_callback(f"Downloading {image.name}...", percent)
+        
+        return sha256_hash.hexdigest()
+    
     def _verify_image_integrity(self, file_path: Path, expected_hash: str) -> bool:
         """Verify the SHA256 hash of a downloaded image."""
         try:
-            sha256_hash = hashlib.sha256()
+            stat = os.stat(file_path)
+            key = str(file_path)
+            cache = self._load_verify_cache()
+            entry = cache.get(key)
+            if entry and entry.get('mtime_ns') == stat.st_mtime_ns and entry.get('size') == stat.st_size:
+                # File is unchanged since it was last hashed
+                return entry.get('sha256') == expected_hash.lower()
+            
             with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(chunk)
+                if hasattr(hashlib, 'file_digest'):
+                    digest = hashlib.file_digest(f, 'sha256').hexdigest()
+                else:
+                    # Python < 3.11: hash the mapped file in a single update
+                    sha256_hash = hashlib.sha256()
+                    if os.fstat(f.fileno()).st_size:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            sha256_hash.update(mm)
+                    digest = sha256_hash.hexdigest()
             
-            return sha256_hash.hexdigest().lower() == expected_hash.lower()
+            self._remember_digest(file_path, digest, stat)
+            return digest == expected_hash.lower()
         except Exception:
             return False
     
-    def format_size(self, size_mb: int) -> str:
+    def _load_verify_cache(self) -> Dict[str, Dict]:
+        """Load the on-disk record of previously hashed images."""
+        with self._verify_lock:
+            if self._verify_cache is None:
+                try:
+                    with open(self.cache_dir / VERIFY_CACHE_FILENAME, 'r') as f:
+                        self._verify_cache = json.load(f)
+                except (OSError, ValueError):
+                    self._verify_cache = {}
+            return self._verify_cache
+    
+    def _remember_digest(self, file_path: Path, digest: str, stat=None):
+        """Record a file's SHA256 keyed by its size and mtime, and persist the cache."""
+        try:
+            stat = stat or file_path.stat()
+        except OSError:
+            return
+        cache = self._load_verify_cache()
+        with self._verify_lock:
+            cache[str(file_path)] = {
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'sha256': digest
+            }
+            # Dump a snapshot, written under the lock so an older one never lands last
+            self._write_json_atomic(self.cache_dir / VERIFY_CACHE_FILENAME, dict(cache))
+    
+    @staticmethod
+    def format_size(size_mb: int) -> str:
         """Format size in MB to human-readable string."""
         if size_mb < 1024:
             return f"{size_mb} MB"
@@ -370,6 +641,7 @@ class BaseImageCatalog:
         if self.cache_dir.exists():
             shutil.rmtree(self.cache_dir)
             self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._verify_cache = None
 
 
 def main():
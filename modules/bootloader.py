@@ -6,249 +6,32 @@ This module handles GRUB bootloader installation for Weirding Modules,
 providing UEFI/BIOS compatibility and hardware detection capabilities.
 """
 
+import shutil
 import subprocess
 import os
-import tempfile
-import shutil
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from pathlib import Path
-import time
+from string import Template
 
-from device_setup import DriveInfo
+from device_setup import DriveInfo, MNT_DETACH, _umount2
 from partitioner import PartitionPlan
 
 
-class BootloaderInstaller:
-    """Handles GRUB bootloader installation for Weirding Modules."""
-    
-    def __init__(self):
-        self.mount_base = Path("/tmp/weirding_mounts")
-        self.mount_base.mkdir(exist_ok=True)
-        
-    def install_bootloader(self, plan: PartitionPlan, progress_callback=None) -> bool:
-        """
-        Install GRUB bootloader on the Weirding Module.
-        
-        Args:
-            plan: PartitionPlan with partition information
-            progress_callback: Optional callback for progress updates
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            # Step 1: Mount the necessary partitions
-            if progress_callback:
-                progress_callback("Mounting partitions for bootloader installation...")
-            
-            mount_points = self._mount_partitions(plan)
-            if not mount_points:
-                return False
-            
-            # Step 2: Install GRUB for both UEFI and BIOS
-            if progress_callback:
-                progress_callback("Installing GRUB bootloader...")
-            
-            success = self._install_grub(plan, mount_points, progress_callback)
-            
-            if success:
-                # Step 3: Generate GRUB configuration
-                if progress_callback:
-                    progress_callback("Generating GRUB configuration...")
-                
-                success = self._generate_grub_config(plan, mount_points)
-            
-            # Step 4: Cleanup - unmount partitions
-            self._unmount_partitions(mount_points)
-            
-            return success
-            
-        except Exception as e:
-            print(f"Error installing bootloader: {e}")
-            return False
-    
-    def _mount_partitions(self, plan: PartitionPlan) -> Dict[str, str]:
-        """
-        Mount the necessary partitions for bootloader installation.
-        
-        Args:
-            plan: PartitionPlan with partition information
-            
-        Returns:
-            Dictionary mapping partition types to mount points
-        """
-        mount_points = {}
-        
-        try:
-            # Create mount directories
-            root_mount = self.mount_base / "root"
-            efi_mount = self.mount_base / "efi"
-            
-            root_mount.mkdir(exist_ok=True)
-            efi_mount.mkdir(exist_ok=True)
-            
-            # Find and mount root partition
-            root_partition = None
-            efi_partition = None
-            
-            for partition in plan.partitions:
-                if partition.get('mount_point') == '/':
-                    root_partition = f"{plan.drive.device}{partition['number']}"
-                elif partition.get('mount_point') == '/boot/efi':
-                    efi_partition = f"{plan.drive.device}{partition['number']}"
-            
-            if not root_partition:
-                raise RuntimeError("No root partition found in plan")
-            
-            # Mount root partition
-            subprocess.run([
-                'mount', root_partition, str(root_mount)
-            ], capture_output=True, text=True, check=True)
-            mount_points['root'] = str(root_mount)
-            
-            # Create boot directory structure
-            boot_dir = root_mount / "boot"
-            boot_dir.mkdir(exist_ok=True)
-            
-            # Mount EFI partition if it exists
-            if efi_partition:
-                efi_dir = root_mount / "boot" / "efi"
-                efi_dir.mkdir(exist_ok=True)
-                
-                subprocess.run([
-                    'mount', efi_partition, str(efi_dir)
-                ], capture_output=True, text=True, check=True)
-                mount_points['efi'] = str(efi_dir)
-            
-            return mount_points
-            
-        except subprocess.CalledProcessError as e:
-            print(f"Error mounting partitions: {e.stderr}")
-            self._unmount_partitions(mount_points)
-            return {}
-        except Exception as e:
-            print(f"Error in partition mounting: {e}")
-            self._unmount_partitions(mount_points)
-            return {}
-    
-    def _install_grub(self, plan: PartitionPlan, mount_points: Dict[str, str], progress_callback=None) -> bool:
-        """
-        Install GRUB bootloader for both UEFI and BIOS.
-        
-        Args:
-            plan: PartitionPlan with partition information
-            mount_points: Dictionary of mounted partition paths
-            progress_callback: Optional progress callback
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            root_mount = mount_points['root']
-            device = plan.drive.device
-            
-            # Install GRUB for BIOS (MBR) compatibility
-            if progress_callback:
-                progress_callback("Installing GRUB for BIOS compatibility...")
-            
-            subprocess.run([
-                'grub-install',
-                '--target=i386-pc',
-                '--boot-directory', f"{root_mount}/boot",
-                '--recheck',
-                device
-            ], capture_output=True, text=True, check=True)
-            
-            # Install GRUB for UEFI if EFI partition exists
-            if 'efi' in mount_points:
-                if progress_callback:
-                    progress_callback("Installing GRUB for UEFI compatibility...")
-                
-                subprocess.run([
-                    'grub-install',
-                    '--target=x86_64-efi',
-                    '--efi-directory', mount_points['efi'],
-                    '--boot-directory', f"{root_mount}/boot",
-                    '--bootloader-id=WEIRDING',
-                    '--recheck'
-                ], capture_output=True, text=True, check=True)
-            
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            print(f"Error installing GRUB: {e.stderr}")
-            return False
-    
-    def _generate_grub_config(self, plan: PartitionPlan, mount_points: Dict[str, str]) -> bool:
-        """
-        Generate GRUB configuration file with hardware detection.
-        
-        Args:
-            plan: PartitionPlan with partition information
-            mount_points: Dictionary of mounted partition paths
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            root_mount = mount_points['root']
-            grub_dir = Path(root_mount) / "boot" / "grub"
-            grub_dir.mkdir(exist_ok=True)
-            
-            # Find root partition UUID
-            root_partition = None
-            for partition in plan.partitions:
-                if partition.get('mount_point') == '/':
-                    root_partition = f"{plan.drive.device}{partition['number']}"
-                    break
-            
-            if not root_partition:
-                raise RuntimeError("No root partition found")
-            
-            # Get partition UUID
-            result = subprocess.run([
-                'blkid', '-s', 'UUID', '-o', 'value', root_partition
-            ], capture_output=True, text=True, check=True)
-            root_uuid = result.stdout.strip()
-            
-            # Generate GRUB configuration
-            grub_config = self._create_grub_config_content(root_uuid, plan)
-            
-            # Write GRUB configuration
-            grub_cfg_path = grub_dir / "grub.cfg"
-            with open(grub_cfg_path, 'w') as f:
-                f.write(grub_config)
-            
-            # Set proper permissions
-            os.chmod(grub_cfg_path, 0o644)
-            
-            return True
-            
-        except subprocess.CalledProcessError as e:
-            print(f"Error generating GRUB config: {e.stderr}")
-            return False
-        except Exception as e:
-            print(f"Error in GRUB config generation: {e}")
-            return False
-    
-    def _create_grub_config_content(self, root_uuid: str, plan: PartitionPlan) -> str:
-        """
-        Create GRUB configuration content with hardware detection.
-        
-        Args:
-            root_uuid: UUID of the root partition
-            plan: PartitionPlan with partition information
-            
-        Returns:
-            GRUB configuration content as string
-        """
-        module_name = "Weirding"
-        for partition in plan.partitions:
-            if 'ROOT' in partition.get('label', ''):
-                module_name = partition['label'].replace('_ROOT', '')
-                break
-        
-        config = f'''# GRUB Configuration for {module_name} Weirding Module
+# Mount points the bootloader cares about, keyed to their _index_partitions slot
+_PARTITION_INDEX_KEYS = {'/': 'root', '/boot/efi': 'efi'}
+
+# External tools resolved once at import; mount/blkid fall back to a PATH
+# lookup at exec time, grub-install is checked up front by install_bootloader
+_GRUB_INSTALL = shutil.which('grub-install')
+_BLKID = shutil.which('blkid') or 'blkid'
+_MOUNT = shutil.which('mount') or 'mount'
+
+# Output is only ever read from stderr, and only when the command fails
+_RUN_KW = dict(stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
+
+# GRUB configuration skeleton; only $module_name and $root_uuid are filled in at
+# install time, every other $ is a GRUB variable left untouched by safe_substitute.
+_GRUB_HEADER_TMPL = Template('''# GRUB Configuration for $module_name Weirding Module
 # Generated automatically - do not edit manually
 
 set timeout=5
@@ -282,7 +65,7 @@ if loadfont /boot/grub/fonts/unicode.pf2 ; then
 fi
 
 # Hardware detection function
-function detect_hardware {{
+function detect_hardware {
     echo "Detecting hardware configuration..."
     
     # Detect CPU information
@@ -295,7 +78,7 @@ function detect_hardware {{
     fi
     
     # Detect memory
-    set memory_mb=`cat /proc/meminfo | grep MemTotal | awk '{{print $2/1024}}'`
+    set memory_mb=`cat /proc/meminfo | grep MemTotal | awk '{print $2/1024}'`
     
     # Set optimization flags based on hardware
     if [ "$cpu_vendor" = "Intel" ]; then
@@ -305,51 +88,49 @@ function detect_hardware {{
     else
         set kernel_params=""
     fi
-}}
+}
 
 # Main menu entry for Weirding Module
-menuentry "{module_name} AI Server (Hardware Adaptive)" {{
+menuentry "$module_name AI Server (Hardware Adaptive)" {
     call detect_hardware
     
-    search --no-floppy --fs-uuid --set=root {root_uuid}
+    search --no-floppy --fs-uuid --set=root $root_uuid
     
-    echo "Loading {module_name} Weirding Module..."
-    echo "Hardware: $cpu_vendor CPU, ${{memory_mb}}MB RAM"
+    echo "Loading $module_name Weirding Module..."
+    echo "Hardware: $cpu_vendor CPU, ${memory_mb}MB RAM"
     echo "Optimizations: $kernel_params"
     
-    linux /boot/vmlinuz root=UUID={root_uuid} ro quiet splash $kernel_params weirding.mode=adaptive
+    linux /boot/vmlinuz root=UUID=$root_uuid ro quiet splash $kernel_params weirding.mode=adaptive
     initrd /boot/initrd.img
-}}
+}
 
 # Recovery mode entry
-menuentry "{module_name} AI Server (Recovery Mode)" {{
-    search --no-floppy --fs-uuid --set=root {root_uuid}
+menuentry "$module_name AI Server (Recovery Mode)" {
+    search --no-floppy --fs-uuid --set=root $root_uuid
     
-    echo "Loading {module_name} in recovery mode..."
+    echo "Loading $module_name in recovery mode..."
     
-    linux /boot/vmlinuz root=UUID={root_uuid} ro recovery nomodeset
+    linux /boot/vmlinuz root=UUID=$root_uuid ro recovery nomodeset
     initrd /boot/initrd.img
-}}
+}
 
 # Hardware test entry
-menuentry "Hardware Detection Test" {{
+menuentry "Hardware Detection Test" {
     call detect_hardware
     
     echo "=== Hardware Detection Results ==="
     echo "CPU Vendor: $cpu_vendor"
-    echo "Memory: ${{memory_mb}}MB"
+    echo "Memory: ${memory_mb}MB"
     echo "Kernel Parameters: $kernel_params"
     echo ""
     echo "Press any key to continue..."
     read
-}}
+}
 
 # Chainload to host system (if dual-use mode)
-'''
+''')
 
-        # Add chainload entry for dual-use mode
-        if plan.mode == 'dual_use':
-            config += '''
+_GRUB_CHAINLOAD_BLOCK = '''
 menuentry "Boot Host System" {
     echo "Searching for host system bootloader..."
     
@@ -375,7 +156,7 @@ menuentry "Boot Host System" {
 }
 '''
 
-        config += '''
+_GRUB_FOOTER = '''
 # Advanced options submenu
 submenu "Advanced Options" {
     menuentry "Memory Test (memtest86+)" {
@@ -417,126 +198,10 @@ else
     set efi_optimizations=""
 fi
 '''
-        
-        return config
-    
-    def _unmount_partitions(self, mount_points: Dict[str, str]):
-        """
-        Unmount all mounted partitions.
-        
-        Args:
-            mount_points: Dictionary of mounted partition paths
-        """
-        for mount_type, mount_path in mount_points.items():
-            try:
-                subprocess.run(['umount', mount_path], capture_output=True, text=True, check=True)
-            except subprocess.CalledProcessError:
-                # Try lazy unmount if regular unmount fails
-                try:
-                    subprocess.run(['umount', '-l', mount_path], capture_output=True, text=True, check=True)
-                except subprocess.CalledProcessError:
-                    pass  # Continue with other partitions
-    
-    def verify_bootloader_installation(self, plan: PartitionPlan) -> bool:
-        """
-        Verify that the bootloader was installed correctly.
-        
-        Args:
-            plan: PartitionPlan with partition information
-            
-        Returns:
-            True if bootloader is properly installed, False otherwise
-        """
-        try:
-            device = plan.drive.device
-            
-            # Check for GRUB installation in MBR
-            result = subprocess.run([
-                'dd', f'if={device}', 'bs=512', 'count=1'
-            ], capture_output=True, check=True)
-            
-            # Look for GRUB signature in MBR
-            if b'GRUB' in result.stdout:
-                print("GRUB found in MBR - BIOS boot should work")
-                bios_ok = True
-            else:
-                print("Warning: GRUB not found in MBR - BIOS boot may not work")
-                bios_ok = False
-            
-            # Check for EFI bootloader if EFI partition exists
-            efi_ok = True
-            efi_partition = None
-            for partition in plan.partitions:
-                if partition.get('mount_point') == '/boot/efi':
-                    efi_partition = f"{device}{partition['number']}"
-                    break
-            
-            if efi_partition:
-                # Mount EFI partition temporarily to check
-                with tempfile.TemporaryDirectory() as temp_mount:
-                    try:
-                        subprocess.run(['mount', efi_partition, temp_mount],
-                                     capture_output=True, text=True, check=True)
-                        
-                        efi_file = Path(temp_mount) / "EFI" / "WEIRDING" / "grubx64.efi"
-                        if efi_file.exists():
-                            print("GRUB EFI bootloader found - UEFI boot should work")
-                            efi_ok = True
-                        else:
-                            print("Warning: GRUB EFI bootloader not found - UEFI boot may not work")
-                            efi_ok = False
-                        
-                        subprocess.run(['umount', temp_mount], capture_output=True)
-                        
-                    except subprocess.CalledProcessError:
-                        print("Warning: Could not verify EFI bootloader installation")
-                        efi_ok = False
-            
-            return bios_ok or efi_ok  # At least one boot method should work
-            
-        except Exception as e:
-            print(f"Error verifying bootloader installation: {e}")
-            return False
-    
-    def create_boot_scripts(self, plan: PartitionPlan, mount_points: Dict[str, str]) -> bool:
-        """
-        Create additional boot scripts for hardware detection and optimization.
-        
-        Args:
-            plan: PartitionPlan with partition information
-            mount_points: Dictionary of mounted partition paths
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            root_mount = mount_points['root']
-            scripts_dir = Path(root_mount) / "opt" / "weirding" / "scripts"
-            scripts_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Create hardware detection script
-            hw_detect_script = scripts_dir / "detect_hardware.sh"
-            with open(hw_detect_script, 'w') as f:
-                f.write(self._get_hardware_detection_script())
-            
-            os.chmod(hw_detect_script, 0o755)
-            
-            # Create boot optimization script
-            boot_opt_script = scripts_dir / "optimize_boot.sh"
-            with open(boot_opt_script, 'w') as f:
-                f.write(self._get_boot_optimization_script())
-            
-            os.chmod(boot_opt_script, 0o755)
-            
-            return True
-            
-        except Exception as e:
-            print(f"Error creating boot scripts: {e}")
-            return False
-    
-    def _get_hardware_detection_script(self) -> str:
-        """Get the hardware detection script content."""
-        return '''#!/bin/bash
+
+
+# Boot-time helper scripts installed under /opt/weirding/scripts
+_HW_DETECT_SH = b'''#!/bin/bash
 # Hardware Detection Script for Weirding Module
 # This script detects and optimizes for the current host hardware
 
@@ -603,10 +268,8 @@ EOF
 
 echo "Hardware detection complete. Configuration saved to $HARDWARE_INFO"
 '''
-    
-    def _get_boot_optimization_script(self) -> str:
-        """Get the boot optimization script content."""
-        return '''#!/bin/bash
+
+_BOOT_OPT_SH = b'''#!/bin/bash
 # Boot Optimization Script for Weirding Module
 # This script applies hardware-specific optimizations at boot time
 
@@ -672,6 +335,426 @@ echo "$(date): Boot optimization complete" | tee -a "$OPTIMIZATION_LOG"
 '''
 
 
+class BootloaderInstaller:
+    """Handles GRUB bootloader installation for Weirding Modules."""
+    
+    def __init__(self):
+        self.mount_base = Path("/tmp/weirding_mounts")
+        self.mount_base.mkdir(exist_ok=True)
+        # Scratch mount point reused by every verification run
+        self._verify_mount = os.path.join(self.mount_base, "verify")
+        os.makedirs(self._verify_mount, exist_ok=True)
+        # Generated grub.cfg content keyed by (mode, root UUID, module name)
+        self._config_cache: Dict[Tuple[str, str, str], str] = {}
+        
+    def install_bootloader(self, plan: PartitionPlan, progress_callback=None) -> bool:
+        """
+        Install GRUB bootloader on the Weirding Module.
+        
+        Args:
+            plan: PartitionPlan with partition information
+            progress_callback: Optional callback for progress updates
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if _GRUB_INSTALL is None:
+            print("Error installing bootloader: grub-install not found")
+            return False
+        
+        try:
+            partitions = self._index_partitions(plan)
+            
+            # Step 1: Mount the necessary partitions
+            if progress_callback:
+                progress_callback("Mounting partitions for bootloader installation...")
+            
+            mount_points = self._mount_partitions(partitions)
+            if not mount_points:
+                return False
+            
+            # Step 2: Install GRUB for both UEFI and BIOS
+            if progress_callback:
+                progress_callback("Installing GRUB bootloader...")
+            
+            success = self._install_grub(plan, mount_points, progress_callback)
+            
+            if success:
+                # Step 3: Generate GRUB configuration
+                if progress_callback:
+                    progress_callback("Generating GRUB configuration...")
+                
+                success = self._generate_grub_config(plan, partitions, mount_points)
+            
+            # Step 4: Cleanup - unmount partitions
+            self._unmount_partitions(mount_points)
+            
+            return success
+            
+        except Exception as e:
+            print(f"Error installing bootloader: {e}")
+            return False
+    
+    def _index_partitions(self, plan: PartitionPlan) -> Dict[str, str]:
+        """
+        Resolve the partitions the bootloader needs in a single pass over the plan.
+        
+        Args:
+            plan: PartitionPlan with partition information
+            
+        Returns:
+            Dictionary with 'root' and 'efi' partition device paths (when present)
+            and the 'module_name' taken from the root partition label
+        """
+        index = {}
+        module_name = None
+        device = plan.drive.device
+        for partition in plan.partitions:
+            key = _PARTITION_INDEX_KEYS.get(partition.get('mount_point'))
+            if key and key not in index:
+                index[key] = f"{device}{partition['number']}"
+            
+            if module_name is None and 'ROOT' in partition.get('label', ''):
+                module_name = partition['label'].replace('_ROOT', '')
+        
+        index['module_name'] = module_name or "Weirding"
+        return index
+    
+    def _mount_partitions(self, partitions: Dict[str, str]) -> Dict[str, str]:
+        """
+        Mount the necessary partitions for bootloader installation.
+        
+        Args:
+            partitions: Partition index from _index_partitions
+            
+        Returns:
+            Dictionary mapping partition types to mount points
+        """
+        mount_points = {}
+        
+        try:
+            # Create mount directory
+            root_mount = os.path.join(self.mount_base, "root")
+            os.makedirs(root_mount, exist_ok=True)
+            
+            # Find and mount root partition
+            root_partition = partitions.get('root')
+            efi_partition = partitions.get('efi')
+            
+            if not root_partition:
+                raise RuntimeError("No root partition found in plan")
+            
+            # Mount root partition
+            subprocess.run([
+                _MOUNT, root_partition, root_mount
+            ], **_RUN_KW)
+            mount_points['root'] = root_mount
+            
+            # Create boot directory structure (inside the mounted root)
+            boot_dir = f"{root_mount}/boot"
+            efi_dir = f"{boot_dir}/efi"
+            os.makedirs(efi_dir if efi_partition else boot_dir, exist_ok=True)
+            
+            # Mount EFI partition if it exists
+            if efi_partition:
+                subprocess.run([
+                    _MOUNT, efi_partition, efi_dir
+                ], **_RUN_KW)
+                mount_points['efi'] = efi_dir
+            
+            return mount_points
+            
+        except subprocess.CalledProcessError as e:
+            print(f"Error mounting partitions: {e.stderr.decode(errors='replace')}")
+            self._unmount_partitions(mount_points)
+            return {}
+        except Exception as e:
+            print(f"Error in partition mounting: {e}")
+            self._unmount_partitions(mount_points)
+            return {}
+    
+    def _install_grub(self, plan: PartitionPlan, mount_points: Dict[str, str], progress_callback=None) -> bool:
+        """
+        Install GRUB bootloader for both UEFI and BIOS.
+        
+        Args:
+            plan: PartitionPlan with partition information
+            mount_points: Dictionary of mounted partition paths
+            progress_callback: Optional progress callback
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            root_mount = mount_points['root']
+            device = plan.drive.device
+            
+            # BIOS (MBR) and UEFI installs share --boot-directory (grubenv, fonts,
+            # locale), so they must run one after the other
+            commands = [[
+                _GRUB_INSTALL,
+                '--target=i386-pc',
+                '--boot-directory', f"{root_mount}/boot",
+                '--recheck',
+                device
+            ]]
+            
+            if 'efi' in mount_points:
+                commands.append([
+                    _GRUB_INSTALL,
+                    '--target=x86_64-efi',
+                    '--efi-directory', mount_points['efi'],
+                    '--boot-directory', f"{root_mount}/boot",
+                    '--bootloader-id=WEIRDING',
+                    '--recheck'
+                ])
+            
+            if progress_callback:
+                if len(commands) > 1:
+                    progress_callback("Installing GRUB for BIOS and UEFI compatibility...")
+                else:
+                    progress_callback("Installing GRUB for BIOS compatibility...")
+            
+            for cmd in commands:
+                subprocess.run(cmd, **_RUN_KW)
+            
+            return True
+            
+        except subprocess.CalledProcessError as e:
+            print(f"Error installing GRUB: {e.stderr.decode(errors='replace')}")
+            return False
+    
+    def _generate_grub_config(self, plan: PartitionPlan, partitions: Dict[str, str],
+                              mount_points: Dict[str, str]) -> bool:
+        """
+        Generate GRUB configuration file with hardware detection.
+        
+        Args:
+            plan: PartitionPlan with partition information
+            partitions: Partition index from _index_partitions
+            mount_points: Dictionary of mounted partition paths
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            root_mount = mount_points['root']
+            grub_dir = f"{root_mount}/boot/grub"
+            os.makedirs(grub_dir, exist_ok=True)
+            
+            # _mount_partitions already resolved and mounted the root device
+            root_partition = partitions['root']
+            
+            # Get partition UUID, shelling out to blkid only if udev has no link for it
+            root_uuid = self._get_uuid(root_partition)
+            if not root_uuid:
+                result = subprocess.run([
+                    _BLKID, '-s', 'UUID', '-o', 'value', root_partition
+                ], stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+                root_uuid = result.stdout.decode().strip()
+            
+            # Generate GRUB configuration
+            grub_config = self._create_grub_config_content(root_uuid, plan, partitions['module_name'])
+            
+            # Write GRUB configuration
+            grub_cfg_path = f"{grub_dir}/grub.cfg"
+            self._write_file(grub_cfg_path, grub_config, 0o644)
+            
+            return True
+            
+        except subprocess.CalledProcessError as e:
+            print(f"Error generating GRUB config: {e.stderr.decode(errors='replace')}")
+            return False
+        except Exception as e:
+            print(f"Error in GRUB config generation: {e}")
+            return False
+    
+    def _write_file(self, path: str, content: Union[str, bytes], mode: int):
+        """
+        Write a generated file in one pass via a temp file and rename, so an
+        interrupted install never leaves a truncated file behind.
+        
+        Args:
+            path: Destination file path
+            content: File contents (str is encoded as UTF-8)
+            mode: Permission bits for the file
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        data = memoryview(content)
+        tmp_path = f"{path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, mode)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+            # The create mode is filtered by umask and ignored for existing files
+            os.fchmod(fd, mode)
+        except BaseException:
+            os.close(fd)
+            os.unlink(tmp_path)
+            raise
+        os.close(fd)
+        os.replace(tmp_path, path)
+    
+    def _get_uuid(self, dev_path: str) -> Optional[str]:
+        """
+        Look up a partition's filesystem UUID from the /dev/disk/by-uuid symlinks.
+        
+        Args:
+            dev_path: Partition device path (e.g., /dev/sdb2)
+            
+        Returns:
+            UUID string, or None if no symlink resolves to the device
+        """
+        by_uuid = "/dev/disk/by-uuid"
+        try:
+            names = os.listdir(by_uuid)
+        except OSError:
+            return None
+        
+        target = os.path.realpath(dev_path)
+        for name in names:
+            if os.path.realpath(f"{by_uuid}/{name}") == target:
+                return name
+        return None
+    
+    def _create_grub_config_content(self, root_uuid: str, plan: PartitionPlan, module_name: str) -> str:
+        """
+        Create GRUB configuration content with hardware detection.
+        
+        Args:
+            root_uuid: UUID of the root partition
+            plan: PartitionPlan with partition information
+            module_name: Module name shown in the boot menu
+            
+        Returns:
+            GRUB configuration content as string
+        """
+        key = (plan.mode, root_uuid, module_name)
+        cached = self._config_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        config = "".join((
+            _GRUB_HEADER_TMPL.safe_substitute(module_name=module_name, root_uuid=root_uuid),
+            # Add chainload entry for dual-use mode
+            _GRUB_CHAINLOAD_BLOCK if plan.mode == 'dual_use' else '',
+            _GRUB_FOOTER,
+        ))
+        self._config_cache[key] = config
+        return config
+    
+    def _unmount_partitions(self, mount_points: Dict[str, str]):
+        """
+        Unmount all mounted partitions.
+        
+        Args:
+            mount_points: Dictionary of mounted partition paths
+        """
+        if not mount_points:
+            return
+        
+        # Nested mounts (EFI inside root) must go first: unmount deepest path first
+        mount_paths = sorted(mount_points.values(), key=lambda path: path.count('/'), reverse=True)
+        for mount_path in mount_paths:
+            # Try lazy unmount if regular unmount fails
+            if not _umount2(mount_path, 0):
+                _umount2(mount_path, MNT_DETACH)
+    
+    def verify_bootloader_installation(self, plan: PartitionPlan) -> bool:
+        """
+        Verify that the bootloader was installed correctly.
+        
+        Args:
+            plan: PartitionPlan with partition information
+            
+        Returns:
+            True if bootloader is properly installed, False otherwise
+        """
+        try:
+            device = plan.drive.device
+            
+            # Check for GRUB installation in MBR (read in-process; an OSError
+            # here is reported like any other verification failure)
+            fd = os.open(device, os.O_RDONLY | os.O_CLOEXEC)
+            try:
+                mbr = os.pread(fd, 512, 0)
+            finally:
+                os.close(fd)
+            
+            # Look for GRUB signature in MBR
+            bios_ok = b'GRUB' in mbr
+            if bios_ok:
+                print("GRUB found in MBR - BIOS boot should work")
+            else:
+                print("Warning: GRUB not found in MBR - BIOS boot may not work")
+            
+            # Check for EFI bootloader if EFI partition exists
+            efi_ok = True
+            efi_partition = self._index_partitions(plan).get('efi')
+            
+            if efi_partition:
+                # Mount EFI partition temporarily to check
+                verify_mount = self._verify_mount
+                try:
+                    subprocess.run([_MOUNT, efi_partition, verify_mount], **_RUN_KW)
+                except subprocess.CalledProcessError:
+                    print("Warning: Could not verify EFI bootloader installation")
+                    efi_ok = False
+                else:
+                    try:
+                        if os.path.exists(f"{verify_mount}/EFI/WEIRDING/grubx64.efi"):
+                            print("GRUB EFI bootloader found - UEFI boot should work")
+                            efi_ok = True
+                        else:
+                            print("Warning: GRUB EFI bootloader not found - UEFI boot may not work")
+                            efi_ok = False
+                    finally:
+                        if not _umount2(verify_mount, 0):
+                            _umount2(verify_mount, MNT_DETACH)
+            
+            return bios_ok or efi_ok  # At least one boot method should work
+            
+        except Exception as e:
+            print(f"Error verifying bootloader installation: {e}")
+            return False
+    
+    def create_boot_scripts(self, plan: PartitionPlan, mount_points: Dict[str, str]) -> bool:
+        """
+        Create additional boot scripts for hardware detection and optimization.
+        
+        Args:
+            plan: PartitionPlan with partition information
+            mount_points: Dictionary of mounted partition paths
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            root_mount = mount_points['root']
+            scripts_dir = f"{root_mount}/opt/weirding/scripts"
+            os.makedirs(scripts_dir, exist_ok=True)
+            
+            # Create hardware detection and boot optimization scripts
+            for name, body in (("detect_hardware.sh", self._get_hardware_detection_script()),
+                               ("optimize_boot.sh", self._get_boot_optimization_script())):
+                self._write_file(f"{scripts_dir}/{name}", body, 0o755)
+            
+            return True
+            
+        except Exception as e:
+            print(f"Error creating boot scripts: {e}")
+            return False
+    
+    def _get_hardware_detection_script(self) -> bytes:
+        """Get the hardware detection script content."""
+        return _HW_DETECT_SH
+    
+    def _get_boot_optimization_script(self) -> bytes:
+        """Get the boot optimization script content."""
+        return _BOOT_OPT_SH
+
+
 def main():
     """Test the bootloader installer functionality."""
     from device_setup import DriveDetector
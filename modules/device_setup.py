@@ -6,16 +6,264 @@ This module handles detection, analysis, and setup of external storage devices
 for conversion into Weirding Modules (portable AI servers).
 """
 
+import atexit
+import ctypes
+import ctypes.util
+import functools
 import subprocess
 import json
 import re
 import os
-from typing import List, Dict, Optional, Tuple
+import select
+import socket
+import tempfile
+import time
+from typing import List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
+# Prefer orjson for decoding lsblk output when installed; stdlib json otherwise
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
 
-@dataclass
+
+# Block device listing used for drive detection; -b reports sizes in bytes
+LSBLK_COMMAND = ['lsblk', '-J', '-b', '-o', 'NAME,SIZE,MODEL,VENDOR,SERIAL,RM,MOUNTPOINT,FSTYPE,LABEL,TYPE,TRAN']
+
+# Kernel block device directory read by DriveDetector._sysfs_scan
+SYS_BLOCK_DIR = '/sys/block'
+
+# Mount table with the major:minor of each mounted device, read once per scan
+MOUNTINFO_PATH = '/proc/self/mountinfo'
+
+# /sys/block entries that are never drives (loop, RAM disks, optical), skipped unread
+_SYSFS_SKIP_PREFIXES = ('loop', 'ram', 'zram', 'sr')
+
+# udev database with per-device probe results (filesystem type, label, serial)
+UDEV_DATA_DIR = '/run/udev/data'
+
+# Transport names as lsblk reports them, matched against the sysfs device path
+_SYSFS_TRANSPORTS = (('/usb', 'usb'), ('/nvme', 'nvme'), ('/ata', 'sata'))
+
+# Octal escapes in /proc/self/mounts and mountinfo fields (e.g., \040 for a space)
+_MOUNTS_ESCAPE_RE = re.compile(r'\\([0-7]{3})')
+
+# Hex escapes in udev *_ENC properties (e.g., \x20 for a space)
+_UDEV_ESCAPE_RE = re.compile(r'\\x([0-9a-fA-F]{2})')
+
+# Binary multipliers for lsblk size suffixes
+SIZE_MULTIPLIERS = {
+    'K': 1024,
+    'M': 1024**2,
+    'G': 1024**3,
+    'T': 1024**4,
+    'P': 1024**5,
+    'E': 1024**6
+}
+
+# Display units used by DriveDetector.format_size, one per factor of 1024
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB', 'EB')
+
+# Characters not allowed in a filesystem label
+_LABEL_SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_-]')
+
+# Backslash escapes in `blkid -o export` values
+_EXPORT_ESCAPE_RE = re.compile(r'\\(.)')
+
+# Seconds a `blkid -o export` snapshot stays valid for label/type lookups
+BLKID_CACHE_TTL = 2.0
+
+# Smallest drive accepted for a Weirding Module (32GB)
+MIN_DRIVE_SIZE = 32 * 1024**3
+
+# Connection types a Weirding Module drive may use
+SUPPORTED_CONNECTION_TYPES = ('USB', 'UNKNOWN')
+
+# Seconds an os.statvfs result stays valid for drive usage analysis
+STATVFS_CACHE_TTL = 1.0
+
+# umount2(2) flag for a lazy unmount
+MNT_DETACH = 2
+
+# Netlink protocol for kernel uevents (not exported by the socket module)
+NETLINK_KOBJECT_UEVENT = 15
+
+# Receive buffer for kernel uevent messages (each is at most a few KB)
+UEVENT_BUFFER_SIZE = 8192
+
+_libc = None
+_libblkid = None
+_libc_free = None
+
+
+def _load_libblkid():
+    """Load libblkid once, returning None when it is not installed."""
+    global _libblkid, _libc_free
+    if _libblkid is None:
+        try:
+            lib = ctypes.CDLL(ctypes.util.find_library('blkid') or 'libblkid.so.1')
+            lib.blkid_get_cache.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_char_p]
+            lib.blkid_get_cache.restype = ctypes.c_int
+            # Returned strings are malloc'd and must be released with free()
+            lib.blkid_get_tag_value.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_char_p]
+            lib.blkid_get_tag_value.restype = ctypes.c_void_p
+            _libc_free = ctypes.CDLL(None).free
+            _libc_free.argtypes = [ctypes.c_void_p]
+            _libblkid = lib
+        except (OSError, AttributeError):
+            _libblkid = False
+    return _libblkid or None
+
+
+@functools.lru_cache(maxsize=256)
+def _format_size(bytes_size: int) -> str:
+    """Format a byte count with the largest unit that keeps it at or above 1."""
+    # bit_length picks the power-of-1024 unit directly instead of dividing in a loop
+    whole = int(bytes_size)
+    unit = min(len(SIZE_UNITS) - 1, (whole.bit_length() - 1) // 10) if whole >= 1024 else 0
+    return f"{bytes_size / (1 << (unit * 10)):.1f} {SIZE_UNITS[unit]}"
+
+
+def _umount2(path: str, flags: int) -> bool:
+    """Unmount a path with umount2(2), falling back to the umount binary without libc."""
+    global _libc
+    if _libc is None:
+        try:
+            _libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            _libc.umount2.argtypes = [ctypes.c_char_p, ctypes.c_int]
+        except (OSError, AttributeError):
+            _libc = False
+    
+    if _libc is not False:
+        return _libc.umount2(os.fsencode(path), flags) == 0
+    
+    cmd = ['umount', '-l', path] if flags & MNT_DETACH else ['umount', path]
+    return subprocess.run(cmd, capture_output=True).returncode == 0
+
+
+def _remove_files(*paths: str):
+    """Remove files that still exist (used for atexit cleanup)."""
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def _read_sysfs(path: str) -> Optional[str]:
+    """Read a sysfs attribute, returning None if it does not exist."""
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _read_udev_properties(dev_numbers: Optional[str]) -> Optional[Dict[str, str]]:
+    """Read the E: properties udev recorded for a block device (major:minor)."""
+    if not dev_numbers:
+        return None
+    try:
+        with open(f"{UDEV_DATA_DIR}/b{dev_numbers}") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+    return dict(line[2:].partition('=')[::2] for line in lines if line.startswith('E:'))
+
+
+def _sysfs_is_external(path: str) -> bool:
+    """Apply _parse_drive_info's external test (removable or USB) to a sysfs entry."""
+    return _read_sysfs(f"{path}/removable") == '1' or _sysfs_transport(path) == 'usb'
+
+
+def _uevent_affects_drives(message: bytes) -> bool:
+    """Check whether a kernel uevent is for a block device the scan would report."""
+    fields = message.split(b'\0')
+    if b'SUBSYSTEM=block' not in fields:
+        return False
+    for field in fields:
+        if field.startswith(b'DEVNAME='):
+            # Kernel DEVNAME is relative to /dev (e.g., sdc1, loop3)
+            return not os.fsdecode(field[8:]).startswith(_SYSFS_SKIP_PREFIXES)
+    return True
+
+
+def _read_mountpoints(mountinfo: Optional[bytes] = None) -> Dict[str, str]:
+    """
+    Map mounted devices to their first mountpoint, as lsblk's MOUNTPOINT column.
+    
+    Each mount is keyed by its major:minor (so /dev/root matches) and by the
+    resolved path of its source device, since btrfs and other filesystems on
+    anonymous devices report 0:NN instead of the partition's number.
+    
+    Args:
+        mountinfo: Contents of /proc/self/mountinfo if already read, else it is read here
+    """
+    if mountinfo is None:
+        try:
+            with open(MOUNTINFO_PATH, 'rb') as f:
+                mountinfo = f.read()
+        except OSError:
+            return {}
+    
+    unescape = functools.partial(_MOUNTS_ESCAPE_RE.sub, lambda m: chr(int(m.group(1), 8)))
+    mountpoints = {}
+    for line in os.fsdecode(mountinfo).splitlines():
+        fields = line.split(' ', 5)
+        if len(fields) <= 4:
+            continue
+        mountpoint = unescape(fields[4])
+        mountpoints.setdefault(fields[2], mountpoint)
+        
+        # Optional fields end at " - ", followed by fstype and mount source
+        source_fields = line.partition(' - ')[2].split(' ', 2)
+        if len(source_fields) > 1 and source_fields[1].startswith('/'):
+            mountpoints.setdefault(os.path.realpath(unescape(source_fields[1])), mountpoint)
+    return mountpoints
+
+
+def _sysfs_device_type(path: str, name: str) -> str:
+    """Classify a /sys/block entry the way lsblk's TYPE column does."""
+    if name.startswith('loop'):
+        return 'loop'
+    if name.startswith('dm-'):
+        return 'dm'
+    if name.startswith('md'):
+        return 'md'
+    if _read_sysfs(f"{path}/device/type") == '5':
+        return 'rom'
+    return 'disk'
+
+
+def _sysfs_transport(path: str) -> Optional[str]:
+    """Infer the transport (usb, nvme, ...) from where the device sits in sysfs."""
+    device_path = os.path.realpath(path)
+    for marker, transport in _SYSFS_TRANSPORTS:
+        if marker in device_path:
+            return transport
+    return None
+
+
+def _partition_info(child: Dict) -> Dict:
+    """Convert an lsblk partition entry to a DriveInfo.partitions item."""
+    partition_info = {
+        'name': f"/dev/{child['name']}",
+        'size': child.get('size', ''),
+        'fstype': child.get('fstype', ''),
+        'mountpoint': child.get('mountpoint', '')
+    }
+    # Only present when the scan knew the label; get_current_label looks it up otherwise
+    if 'label' in child:
+        partition_info['label'] = child['label']
+    return partition_info
+
+
+# Slotted but not frozen: the interactive UI clears mount state in place after
+# unmounting, and the list/dict fields would make instances unhashable anyway
+@dataclass(slots=True)
 class DriveInfo:
     """Information about a storage device."""
     device: str
@@ -37,31 +285,85 @@ class DriveDetector:
     """Detects and analyzes storage devices for Weirding Module setup."""
     
     def __init__(self):
-        self.detected_drives: List[DriveInfo] = []
+        self.detected_drives = []
+        # Per-device results of check_drive_requirements/analyze_drive_usage,
+        # valid until the next scan
+        self._requirements_cache: Dict[str, Tuple[bool, List[str]]] = {}
+        self._usage_cache: Dict[str, Dict] = {}
+        # analyze_drive_usage results still being computed by prefetch_drive_usage
+        self._usage_pending: Dict[str, Future] = {}
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        # Filesystem labels keyed by (partition device, drive serial), so a
+        # different drive appearing on the same node is read again
+        self._label_cache: Dict[Tuple[str, str], Optional[str]] = {}
+        # (timestamp, {device: {tag: value}}) from the last `blkid -o export` run
+        self._blkid_cache: Optional[Tuple[float, Dict[str, Dict[str, str]]]] = None
+        # blkid -c cache file shared by this detector's blkid runs, created on first use
+        self._blkid_cache_path: Optional[str] = None
+        # libblkid cache handle, opened on first in-process tag lookup
+        self._blkid_handle: Optional[ctypes.c_void_p] = None
+        # Recent os.statvfs results per mount point, reused within STATVFS_CACHE_TTL
+        self._statvfs_cache: Dict[str, Tuple[float, os.statvfs_result]] = {}
+        # Parsed output of the last scan (sysfs or lsblk), reused by _refresh_drive_info
+        self._last_lsblk_json: Optional[Dict] = None
+        # external_only flag of the last successful scan, or None if it must be redone
+        self._scanned_external_only: Optional[bool] = None
+        # Kernel uevent socket and mountinfo poller that tell when that scan went stale
+        self._uevent_sock: Optional[socket.socket] = None
+        self._mountinfo_poll: Optional[Tuple[select.poll, object]] = None
+        # mountinfo contents read while re-arming the poller, parsed by the next sysfs scan
+        self._mountinfo_data: Optional[bytes] = None
+    
+    @property
+    def detected_drives(self) -> List[DriveInfo]:
+        """Drives found by the last scan."""
+        return self._detected_drives
     
-    def scan_drives(self) -> List[DriveInfo]:
+    @detected_drives.setter
+    def detected_drives(self, drives: List[DriveInfo]):
+        # External drives are split out once per assignment rather than per query
+        self._detected_drives = drives
+        self._external_drives = [drive for drive in drives if drive.is_external]
+    
+    def scan_drives(self, external_only: bool = False) -> List[DriveInfo]:
         """
         Scan system for all storage devices and identify external drives.
         
+        Args:
+            external_only: Skip internal drives entirely instead of parsing them
+            
         Returns:
             List of DriveInfo objects for detected drives
         """
+        # Reuse the last scan until a block device or the mount table changes
+        if self._scanned_external_only == external_only and not self._devices_changed():
+            return self.detected_drives
+        
+        self._watch_devices()
+        self._scanned_external_only = None
         self.detected_drives = []
+        self._requirements_cache.clear()
+        self._usage_cache.clear()
+        self._usage_pending.clear()
+        self._label_cache.clear()
+        self._blkid_cache = None
         
         try:
-            # Use lsblk to get detailed block device information
-            result = subprocess.run([
-                'lsblk', '-J', '-o', 
-                'NAME,SIZE,MODEL,VENDOR,SERIAL,RM,MOUNTPOINT,FSTYPE,TYPE,TRAN'
-            ], capture_output=True, text=True, check=True)
-            
-            lsblk_data = json.loads(result.stdout)
+            # Read sysfs directly; lsblk is only needed for unusual sysfs layouts
+            lsblk_data = self._sysfs_scan(external_only)
+            if lsblk_data is None:
+                lsblk_data = _json.loads(self._run_lsblk())
+            self._last_lsblk_json = lsblk_data
             
+            drives = []
             for device in lsblk_data.get('blockdevices', []):
                 if device.get('type') == 'disk':
-                    drive_info = self._parse_drive_info(device)
+                    drive_info = self._parse_drive_info(device, external_only)
                     if drive_info:
-                        self.detected_drives.append(drive_info)
+                        drives.append(drive_info)
+            self.detected_drives = drives
+            if self._uevent_sock is not None and self._mountinfo_poll is not None:
+                self._scanned_external_only = external_only
             
         except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
             print(f"Error scanning drives: {e}")
@@ -69,50 +371,208 @@ class DriveDetector:
         
         return self.detected_drives
     
-    def _parse_drive_info(self, device_data: Dict) -> Optional[DriveInfo]:
+    def _watch_devices(self):
+        """
+        Start listening for block device and mount changes, if not already.
+        
+        Either watch may be unavailable (no netlink, no /proc), in which case
+        scan_drives simply scans every time.
+        """
+        if self._uevent_sock is None:
+            try:
+                sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM | socket.SOCK_NONBLOCK,
+                                     NETLINK_KOBJECT_UEVENT)
+                sock.bind((0, 1))  # kernel-assigned port, kernel uevent group
+                self._uevent_sock = sock
+            except (AttributeError, OSError):
+                pass
+        
+        if self._mountinfo_poll is None:
+            try:
+                mountinfo = open(MOUNTINFO_PATH, 'rb')
+            except OSError:
+                return
+            poller = select.poll()
+            poller.register(mountinfo, select.POLLPRI)
+            self._mountinfo_data = mountinfo.read()
+            self._mountinfo_poll = (poller, mountinfo)
+    
+    def _devices_changed(self) -> bool:
+        """
+        Drain pending change notifications since the last scan.
+        
+        Returns:
+            True if a block device was added, removed or changed, or a mount
+            or unmount happened
+        """
+        changed = False
+        
+        while True:
+            try:
+                message = self._uevent_sock.recv(UEVENT_BUFFER_SIZE)
+            except BlockingIOError:
+                break
+            except OSError:
+                # ENOBUFS: events were dropped, so assume the worst
+                changed = True
+                break
+            if _uevent_affects_drives(message):
+                changed = True
+        
+        # mountinfo reports POLLPRI after a mount table change until it is read again
+        poller, mountinfo = self._mountinfo_poll
+        if poller.poll(0):
+            mountinfo.seek(0)
+            self._mountinfo_data = mountinfo.read()
+            changed = True
+        
+        return changed
+    
+    def _run_lsblk(self) -> bytes:
+        """
+        Run lsblk for detailed block device information (sizes in bytes).
+        
+        Returns:
+            Raw lsblk JSON output, undecoded so orjson can parse it directly
+        """
+        return subprocess.run(LSBLK_COMMAND, capture_output=True, check=True).stdout
+    
+    def _sysfs_scan(self, external_only: bool = False) -> Optional[Dict]:
+        """
+        Describe block devices from /sys/block, /proc/self/mountinfo and the udev
+        database, in the same shape as `lsblk -J -b` output, without forking.
+        
+        Loop, RAM and optical devices are left out since they are never drives.
+        
+        Args:
+            external_only: Also leave out internal disks, before their partitions
+                and udev data are read
+            
+        Returns:
+            lsblk-style dictionary, or None if sysfs cannot be read
+        """
+        try:
+            entries = sorted(os.scandir(SYS_BLOCK_DIR), key=lambda entry: entry.name)
+        except OSError:
+            return None
+        
+        # Reuse the copy just read by the mount watcher, so mountinfo is read once per scan
+        mountinfo, self._mountinfo_data = self._mountinfo_data, None
+        mountpoints = _read_mountpoints(mountinfo)
+        
+        blockdevices = []
+        try:
+            for entry in entries:
+                if entry.name.startswith(_SYSFS_SKIP_PREFIXES):
+                    continue
+                if external_only and not _sysfs_is_external(entry.path):
+                    continue
+                blockdevices.append(self._sysfs_device(entry.path, entry.name, mountpoints))
+        except OSError:
+            return None
+        
+        return {'blockdevices': blockdevices}
+    
+    def _sysfs_device(self, path: str, name: str, mountpoints: Dict[str, str]) -> Dict:
+        """
+        Describe one /sys/block entry and its partitions as an lsblk device.
+        
+        Args:
+            path: sysfs directory of the block device
+            name: Kernel device name (e.g., sdc)
+            mountpoints: Mountpoint by major:minor and by source device path
+            
+        Returns:
+            lsblk-style device dictionary, with 'children' for partitions
+        """
+        device = self._sysfs_block_info(path, name, mountpoints)
+        udev_serial = device.pop('_serial', None)
+        device['type'] = _sysfs_device_type(path, name)
+        device['rm'] = _read_sysfs(f"{path}/removable") == '1'
+        device['model'] = _read_sysfs(f"{path}/device/model")
+        device['vendor'] = _read_sysfs(f"{path}/device/vendor")
+        device['serial'] = (_read_sysfs(f"{path}/serial") or _read_sysfs(f"{path}/device/serial")
+                            or udev_serial)
+        device['tran'] = _sysfs_transport(path)
+        
+        children = []
+        with os.scandir(path) as sub_entries:
+            for sub_entry in sorted(sub_entries, key=lambda sub: sub.name):
+                if os.path.exists(f"{sub_entry.path}/partition"):
+                    child = self._sysfs_block_info(sub_entry.path, sub_entry.name, mountpoints)
+                    child.pop('_serial', None)
+                    child['type'] = 'part'
+                    children.append(child)
+        if children:
+            device['children'] = children
+        
+        return device
+    
+    def _sysfs_block_info(self, path: str, name: str, mountpoints: Dict[str, str]) -> Dict:
+        """
+        Read the fields shared by disks and partitions from a sysfs block directory.
+        
+        Args:
+            path: sysfs directory of the block device
+            name: Kernel device name (e.g., sdc1)
+            mountpoints: Mountpoint by major:minor and by source device path
+            
+        Returns:
+            lsblk-style device dictionary; 'label' is only set when udev knows it
+        """
+        devnum = _read_sysfs(f"{path}/dev")
+        info = {
+            'name': name,
+            'size': int(_read_sysfs(f"{path}/size") or 0) * 512,
+            'mountpoint': mountpoints.get(devnum) or mountpoints.get(f"/dev/{name}"),
+            'fstype': None,
+        }
+        
+        # Filesystem details come from udev's probe results, as lsblk's do
+        udev = _read_udev_properties(devnum)
+        if udev is not None:
+            info['fstype'] = udev.get('ID_FS_TYPE') or None
+            label = udev.get('ID_FS_LABEL_ENC')
+            if label is not None:
+                label = _UDEV_ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 16)), label)
+            else:
+                label = udev.get('ID_FS_LABEL')
+            info['label'] = label or None
+            info['_serial'] = udev.get('ID_SERIAL_SHORT')
+        
+        return info
+    
+    def _parse_drive_info(self, device_data: Dict, external_only: bool = False) -> Optional[DriveInfo]:
         """
         Parse lsblk device data into DriveInfo object.
         
         Args:
             device_data: Raw device data from lsblk
+            external_only: Return None for internal drives before walking partitions
             
         Returns:
-            DriveInfo object or None if parsing fails
+            DriveInfo object or None if parsing fails (or the drive is internal)
         """
         try:
             device_name = f"/dev/{device_data['name']}"
-            size_str = device_data.get('size', '0')
-            size_bytes = self._parse_size_to_bytes(size_str)
+            size_bytes = self._parse_size_to_bytes(device_data.get('size') or 0)
             
             # Determine if device is external/removable
-            is_removable = device_data.get('rm') == '1'
-            connection_type = device_data.get('tran', 'unknown').upper()
+            is_removable = device_data.get('rm') in (True, '1')  # JSON bool on newer lsblk
+            connection_type = (device_data.get('tran') or 'unknown').upper()
             is_external = is_removable or connection_type == 'USB'
+            if external_only and not is_external:
+                return None
             
             # Get partition information
-            partitions = []
-            mount_points = []
-            mounted = False
-            
-            if 'children' in device_data:
-                for child in device_data['children']:
-                    partition_info = {
-                        'name': f"/dev/{child['name']}",
-                        'size': child.get('size', ''),
-                        'fstype': child.get('fstype', ''),
-                        'mountpoint': child.get('mountpoint', '')
-                    }
-                    partitions.append(partition_info)
-                    
-                    if child.get('mountpoint'):
-                        mount_points.append(child['mountpoint'])
-                        mounted = True
+            partitions = [_partition_info(child) for child in device_data.get('children', ())]
+            mount_points = [partition['mountpoint'] for partition in partitions if partition['mountpoint']]
             
             # Get filesystem info for the main device
             main_mountpoint = device_data.get('mountpoint')
             if main_mountpoint:
                 mount_points.append(main_mountpoint)
-                mounted = True
+            mounted = bool(mount_points)
             
             return DriveInfo(
                 device=device_name,
@@ -134,50 +594,41 @@ class DriveDetector:
             print(f"Error parsing device data: {e}")
             return None
     
-    def _parse_size_to_bytes(self, size_str: str) -> int:
+    def _parse_size_to_bytes(self, size_str: Union[int, str]) -> int:
         """
-        Convert size string (e.g., '1.8T', '500G') to bytes.
+        Convert size (byte count from lsblk -b, or e.g. '1.8T', '500G') to bytes.
         
         Args:
-            size_str: Size string from lsblk
+            size_str: Size from lsblk
             
         Returns:
             Size in bytes
         """
+        if isinstance(size_str, int):
+            return size_str
+        
         if not size_str:
             return 0
         
         # Remove any whitespace
         size_str = size_str.strip()
         
-        # DIAGNOSTIC: Log size parsing
-        print(f"[DEBUG] Parsing size string: '{size_str}'")
+        # lsblk -b reports plain byte counts
+        if size_str.isdigit():
+            return int(size_str)
         
-        # Extract number and unit
-        match = re.match(r'([0-9.]+)([KMGTPE]?)', size_str.upper())
-        if not match:
-            print(f"[DEBUG] Failed to parse size string: '{size_str}'")
+        # Extract number and unit: leading digits/dots, then one suffix letter
+        end = 0
+        length = len(size_str)
+        while end < length and (size_str[end].isdigit() or size_str[end] == '.'):
+            end += 1
+        if end == 0:
             return 0
         
-        number = float(match.group(1))
-        unit = match.group(2)
-        
-        multipliers = {
-            '': 1,
-            'K': 1024,
-            'M': 1024**2,
-            'G': 1024**3,
-            'T': 1024**4,
-            'P': 1024**5,
-            'E': 1024**6
-        }
-        
-        size_bytes = int(number * multipliers.get(unit, 1))
-        
-        # DIAGNOSTIC: Log conversion result
-        print(f"[DEBUG] Size conversion: {number} {unit} = {size_bytes:,} bytes ({size_bytes // (1024**3):.1f} GB)")
+        number = float(size_str[:end])
+        unit = size_str[end:end + 1].upper()
         
-        return size_bytes
+        return int(number * SIZE_MULTIPLIERS.get(unit, 1))
     
     def get_external_drives(self) -> List[DriveInfo]:
         """
@@ -186,7 +637,7 @@ class DriveDetector:
         Returns:
             List of external DriveInfo objects
         """
-        return [drive for drive in self.detected_drives if drive.is_external]
+        return list(self._external_drives)
     
     def analyze_drive_usage(self, drive: DriveInfo) -> Dict:
         """
@@ -198,38 +649,56 @@ class DriveDetector:
         Returns:
             Dictionary with usage analysis
         """
+        cached = self._usage_cache.get(drive.device)
+        if cached is not None:
+            return cached
+        
+        pending = self._usage_pending.pop(drive.device, None)
+        analysis = pending.result() if pending is not None else self._compute_drive_usage(drive)
+        self._usage_cache[drive.device] = analysis
+        return analysis
+    
+    def prefetch_drive_usage(self, drives: List[DriveInfo]):
+        """
+        Start analyze_drive_usage for drives in the background, so the statvfs
+        calls overlap with whatever the caller does next (e.g. rendering a table).
+        
+        Args:
+            drives: Drives that are likely to be analyzed soon
+        """
+        for drive in drives:
+            if drive.device in self._usage_cache or drive.device in self._usage_pending:
+                continue
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(max_workers=4)
+            self._usage_pending[drive.device] = self._prefetch_executor.submit(self._compute_drive_usage, drive)
+    
+    def _compute_drive_usage(self, drive: DriveInfo) -> Dict:
+        """Build the analyze_drive_usage result for a drive, without caching it."""
+        # Calculate used space from mounted partitions; statvfs blocks on I/O,
+        # so slow drives are queried concurrently
+        mountpoints = {partition['mountpoint'] for partition in drive.partitions if partition['mountpoint']}
+        if len(mountpoints) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(mountpoints))) as executor:
+                used = [used_bytes for used_bytes in executor.map(self._used_bytes, mountpoints)
+                        if used_bytes is not None]
+        else:
+            used = [used_bytes for used_bytes in map(self._used_bytes, mountpoints) if used_bytes is not None]
+        used_space = sum(used)
+        
         analysis = {
             'total_size': drive.size,
-            'used_space': 0,
-            'free_space': 0,
+            'used_space': used_space,
+            'free_space': drive.size - used_space,
             'partition_count': len(drive.partitions),
-            'has_data': False,
-            'filesystem_types': [],
+            'has_data': bool(used),
+            # Deduplicated in partition order, so the UI lists them stably
+            'filesystem_types': list(dict.fromkeys(partition['fstype'] for partition in drive.partitions
+                                                   if partition['fstype'])),
             'mount_status': drive.mounted,
             'safety_warnings': []
         }
         
-        # Calculate used space from mounted partitions
-        for partition in drive.partitions:
-            if partition['mountpoint']:
-                try:
-                    statvfs = os.statvfs(partition['mountpoint'])
-                    total_bytes = statvfs.f_frsize * statvfs.f_blocks
-                    free_bytes = statvfs.f_frsize * statvfs.f_bavail
-                    used_bytes = total_bytes - free_bytes
-                    
-                    analysis['used_space'] += used_bytes
-                    analysis['has_data'] = True
-                    
-                except OSError:
-                    pass
-            
-            if partition['fstype']:
-                analysis['filesystem_types'].append(partition['fstype'])
-        
-        analysis['free_space'] = drive.size - analysis['used_space']
-        analysis['filesystem_types'] = list(set(analysis['filesystem_types']))
-        
         # Add safety warnings
         if analysis['has_data']:
             analysis['safety_warnings'].append("Drive contains existing data")
@@ -242,7 +711,36 @@ class DriveDetector:
         
         return analysis
     
-    def format_size(self, bytes_size: int) -> str:
+    def _used_bytes(self, mountpoint: str) -> Optional[int]:
+        """Return bytes in use on a mounted filesystem, or None if it cannot be queried."""
+        try:
+            statvfs = self._cached_statvfs(mountpoint)
+        except OSError:
+            return None
+        return statvfs.f_frsize * (statvfs.f_blocks - statvfs.f_bavail)
+    
+    def _cached_statvfs(self, mountpoint: str, ttl: float = STATVFS_CACHE_TTL) -> os.statvfs_result:
+        """
+        Return os.statvfs for a mount point, reusing a result younger than ttl seconds.
+        
+        Args:
+            mountpoint: Mounted filesystem path
+            ttl: Maximum age in seconds of a cached result
+            
+        Returns:
+            statvfs result for the mount point
+        """
+        now = time.monotonic()
+        cached = self._statvfs_cache.get(mountpoint)
+        if cached is not None and now - cached[0] < ttl:
+            return cached[1]
+        
+        result = os.statvfs(mountpoint)
+        self._statvfs_cache[mountpoint] = (now, result)
+        return result
+    
+    @staticmethod
+    def format_size(bytes_size: int) -> str:
         """
         Format byte size into human-readable string.
         
@@ -252,11 +750,7 @@ class DriveDetector:
         Returns:
             Formatted size string (e.g., '1.5 GB')
         """
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB', 'PB']:
-            if bytes_size < 1024.0:
-                return f"{bytes_size:.1f} {unit}"
-            bytes_size /= 1024.0
-        return f"{bytes_size:.1f} EB"
+        return _format_size(bytes_size)
     
     def check_drive_requirements(self, drive: DriveInfo) -> Tuple[bool, List[str]]:
         """
@@ -268,24 +762,42 @@ class DriveDetector:
         Returns:
             Tuple of (meets_requirements, list_of_issues)
         """
+        cached = self._requirements_cache.get(drive.device)
+        if cached is not None:
+            return cached
+        
         issues = []
         
         # Minimum size requirement (32GB)
-        min_size = 32 * 1024**3  # 32GB in bytes
-        if drive.size < min_size:
-            issues.append(f"Drive too small: {self.format_size(drive.size)} < {self.format_size(min_size)}")
+        if drive.size < MIN_DRIVE_SIZE:
+            issues.append(f"Drive too small: {self.format_size(drive.size)} < {self.format_size(MIN_DRIVE_SIZE)}")
         
         # Check if it's actually external
         if not drive.is_external:
             issues.append("Drive does not appear to be external/removable")
         
         # Check connection type
-        if drive.connection_type not in ['USB', 'UNKNOWN']:
+        if drive.connection_type not in SUPPORTED_CONNECTION_TYPES:
             issues.append(f"Unusual connection type: {drive.connection_type}")
         
-        return len(issues) == 0, issues
-
-
+        result = (len(issues) == 0, issues)
+        self._requirements_cache[drive.device] = result
+        return result
+    
+    def is_suitable(self, drive: DriveInfo) -> bool:
+        """
+        Check if drive meets the Weirding Module requirements, without building
+        the list of issues that check_drive_requirements reports.
+        
+        Args:
+            drive: DriveInfo object to check
+            
+        Returns:
+            True if the drive meets all requirements
+        """
+        return (drive.size >= MIN_DRIVE_SIZE and drive.is_external
+                and drive.connection_type in SUPPORTED_CONNECTION_TYPES)
+    
     def relabel_drive(self, drive: DriveInfo, new_label: str) -> Tuple[bool, str]:
         """
         Relabel a drive with a new filesystem label.
@@ -308,7 +820,7 @@ class DriveDetector:
             return False, "Root privileges required for drive relabeling. Please run with sudo."
         
         # Sanitize label - remove invalid characters
-        sanitized_label = re.sub(r'[^a-zA-Z0-9_-]', '_', new_label.strip())
+        sanitized_label = _LABEL_SANITIZE_RE.sub('_', new_label.strip())
         
         # Limit label length (filesystem dependent, but 11 chars is safe for most)
         if len(sanitized_label) > 11:
@@ -317,6 +829,14 @@ class DriveDetector:
         try:
             # Force unmount all partitions on the drive first
             self._force_unmount_drive(drive.device)
+            self._scanned_external_only = None
+            self._usage_cache.pop(drive.device, None)
+            self._usage_pending.pop(drive.device, None)
+            self._label_cache.clear()
+            self._blkid_cache = None
+            # The label reported by the scan is about to go stale
+            for partition in drive.partitions:
+                partition.pop('label', None)
             
             # Wait a moment for the system to recognize the unmount
             time.sleep(1)
@@ -390,42 +910,53 @@ class DriveDetector:
             device_path: Path to the drive device (e.g., /dev/sdc)
         """
         try:
-            # Get all mounted partitions for this device
-            result = subprocess.run(['mount'], capture_output=True, text=True)
-            mount_lines = result.stdout.split('\n')
-            
-            partitions_to_unmount = []
-            for line in mount_lines:
-                if device_path in line:
-                    parts = line.split()
-                    if len(parts) > 0:
-                        partition = parts[0]
-                        partitions_to_unmount.append(partition)
-            
-            # Unmount each partition
-            for partition in partitions_to_unmount:
-                try:
-                    subprocess.run(['umount', partition], capture_output=True, text=True, check=True)
-                except subprocess.CalledProcessError:
-                    # Try lazy unmount if regular unmount fails
-                    try:
-                        subprocess.run(['umount', '-l', partition], capture_output=True, text=True, check=True)
-                    except subprocess.CalledProcessError:
-                        pass  # Continue with other partitions
-            
-            # Also try to unmount the device itself
-            try:
-                subprocess.run(['umount', device_path], capture_output=True, text=True)
-            except subprocess.CalledProcessError:
-                pass
+            # umount2(2) needs mount targets, so resolve every mount of the drive
+            # and its partitions, deepest first so nested mounts go before parents
+            mounts = sorted(self._drive_mounts(device_path), key=lambda mount: mount[0].count('/'), reverse=True)
+            for mountpoint, fstype in mounts:
+                # Try lazy unmount if regular unmount fails
+                if _umount2(mountpoint, 0) or _umount2(mountpoint, MNT_DETACH):
+                    continue
+                if fstype.startswith('fuse'):
+                    # Userspace filesystems may need their helper to tear down
+                    subprocess.run(['fusermount', '-u', mountpoint], capture_output=True, text=True)
                 
         except Exception:
             pass  # Ignore errors in unmounting
     
+    def _drive_mounts(self, device_path: str) -> List[Tuple[str, str]]:
+        """
+        List mounts of a drive and its partitions from /proc/self/mounts.
+        
+        Args:
+            device_path: Path to the drive device (e.g., /dev/sdc)
+            
+        Returns:
+            (mountpoint, fstype) tuples in mount order
+        """
+        mounts = []
+        prefix_len = len(device_path)
+        with open('/proc/self/mounts') as f:
+            for line in f:
+                fields = line.split(' ', 3)
+                if len(fields) < 3:
+                    continue
+                source = fields[0]
+                # Match the disk itself, /dev/sdc1 or /dev/nvme0n1p1, but not /dev/sdcd
+                if source.startswith(device_path) and (
+                        len(source) == prefix_len or source[prefix_len:].lstrip('p').isdigit()):
+                    mountpoint = _MOUNTS_ESCAPE_RE.sub(lambda m: chr(int(m.group(1), 8)), fields[1])
+                    mounts.append((mountpoint, fields[2]))
+        return mounts
+    
     def _refresh_drive_info(self, device_path: str) -> Optional[DriveInfo]:
         """
         Refresh drive information for a specific device.
         
+        Partition names and filesystem types are taken from the last scan when
+        the device is in it; other devices are read from sysfs, with lsblk as
+        the fallback.
+        
         Args:
             device_path: Path to the drive device (e.g., /dev/sdc)
             
@@ -436,14 +967,25 @@ class DriveDetector:
             # Extract device name from path
             device_name = device_path.replace('/dev/', '')
             
+            if self._last_lsblk_json is not None:
+                for device in self._last_lsblk_json.get('blockdevices', []):
+                    if device.get('type') == 'disk' and device['name'] == device_name:
+                        return self._parse_drive_info(device)
+            
+            sysfs_path = f"{SYS_BLOCK_DIR}/{device_name}"
+            if os.path.isdir(sysfs_path):
+                try:
+                    device = self._sysfs_device(sysfs_path, device_name, _read_mountpoints())
+                except OSError:
+                    device = None
+                if device is not None and device['type'] == 'disk':
+                    return self._parse_drive_info(device)
+            
             # Use lsblk to get updated information
-            result = subprocess.run([
-                'lsblk', '-J', '-o',
-                'NAME,SIZE,MODEL,VENDOR,SERIAL,RM,MOUNTPOINT,FSTYPE,TYPE,TRAN',
-                device_path
-            ], capture_output=True, text=True, check=True)
+            result = subprocess.run(LSBLK_COMMAND + [device_path],
+                                    capture_output=True, check=True)
             
-            lsblk_data = json.loads(result.stdout)
+            lsblk_data = _json.loads(result.stdout)
             
             for device in lsblk_data.get('blockdevices', []):
                 if device.get('type') == 'disk' and device['name'] == device_name:
@@ -464,15 +1006,113 @@ class DriveDetector:
         Returns:
             Filesystem type or None if not detected
         """
+        return self._blkid_tag(partition_device, 'TYPE')
+    
+    def _blkid_cache_file(self) -> str:
+        """
+        Get the blkid cache file for this detector, creating it on first use.
+        
+        Returns:
+            Path to pass to blkid -c; it and blkid's .old backup are removed at exit
+        """
+        if self._blkid_cache_path is None:
+            fd, path = tempfile.mkstemp(prefix='weirding-blkid-', suffix='.tab')
+            os.close(fd)
+            atexit.register(_remove_files, path, path + '.old')
+            self._blkid_cache_path = path
+        return self._blkid_cache_path
+    
+    def _blkid_snapshot(self) -> Dict[str, Dict[str, str]]:
+        """
+        Get blkid tags for every block device from a single blkid run.
+        
+        Returns:
+            Dictionary mapping device paths to their tags (TYPE, LABEL, UUID, ...)
+        """
+        now = time.monotonic()
+        if self._blkid_cache is not None and now - self._blkid_cache[0] < BLKID_CACHE_TTL:
+            return self._blkid_cache[1]
+        
+        snapshot = {}
+        try:
+            result = subprocess.run(['blkid', '-c', self._blkid_cache_file(), '-o', 'export'],
+                                    capture_output=True, text=True, check=True)
+            
+            # Records are blank-line separated KEY=value blocks, each starting with DEVNAME
+            tags = {}
+            for line in result.stdout.splitlines() + ['']:
+                key, sep, value = line.partition('=')
+                if sep:
+                    tags[key] = _EXPORT_ESCAPE_RE.sub(r'\1', value)
+                elif tags:
+                    if 'DEVNAME' in tags:
+                        snapshot[tags.pop('DEVNAME')] = tags
+                    tags = {}
+                    
+        except (subprocess.CalledProcessError, OSError):
+            pass
+        
+        self._blkid_cache = (now, snapshot)
+        return snapshot
+    
+    def _libblkid_tag(self, partition_device: str, tag: str) -> Optional[str]:
+        """
+        Look up a blkid tag in-process through libblkid, without forking blkid.
+        
+        Args:
+            partition_device: Path to partition device (e.g., /dev/sdc1)
+            tag: blkid tag name (e.g., 'TYPE', 'LABEL')
+            
+        Returns:
+            Tag value, or None if unset or libblkid is unavailable
+        """
+        libblkid = _load_libblkid()
+        if libblkid is None:
+            return None
+        
+        if self._blkid_handle is None:
+            handle = ctypes.c_void_p()
+            if libblkid.blkid_get_cache(ctypes.byref(handle), None) != 0:
+                return None
+            self._blkid_handle = handle
+        
+        value = libblkid.blkid_get_tag_value(self._blkid_handle, tag.encode(), os.fsencode(partition_device))
+        if not value:
+            return None
+        try:
+            return ctypes.string_at(value).decode(errors='replace') or None
+        finally:
+            _libc_free(value)
+    
+    def _blkid_tag(self, partition_device: str, tag: str) -> Optional[str]:
+        """
+        Look up one blkid tag for a partition, querying blkid directly only for
+        devices missing from the snapshot.
+        
+        Args:
+            partition_device: Path to partition device (e.g., /dev/sdc1)
+            tag: blkid tag name (e.g., 'TYPE', 'LABEL')
+            
+        Returns:
+            Tag value or None if not set
+        """
+        value = self._libblkid_tag(partition_device, tag)
+        if value is not None:
+            return value
+        
+        tags = self._blkid_snapshot().get(partition_device)
+        if tags is not None:
+            return tags.get(tag) or None
+        
         try:
             result = subprocess.run([
-                'blkid', '-s', 'TYPE', '-o', 'value', partition_device
+                'blkid', '-c', self._blkid_cache_file(), '-s', tag, '-o', 'value', partition_device
             ], capture_output=True, text=True, check=True)
             
-            fstype = result.stdout.strip()
-            return fstype if fstype else None
+            value = result.stdout.strip()
+            return value if value else None
             
-        except subprocess.CalledProcessError:
+        except (subprocess.CalledProcessError, OSError):
             return None
     
     def get_current_label(self, drive: DriveInfo) -> Optional[str]:
@@ -485,26 +1125,34 @@ class DriveDetector:
         Returns:
             Current label or None if not found
         """
-        try:
-            if len(drive.partitions) > 0:
-                partition = drive.partitions[0]
-                partition_device = partition['name']
-                
-                # Use blkid to get filesystem information
-                result = subprocess.run([
-                    'blkid', '-s', 'LABEL', '-o', 'value', partition_device
-                ], capture_output=True, text=True, check=True)
-                
-                label = result.stdout.strip()
-                return label if label else None
-                
-        except subprocess.CalledProcessError:
-            # No label found or command failed
+        if len(drive.partitions) == 0:
             return None
+        
+        partition = drive.partitions[0]
+        # Drives from scan_drives already carry the label lsblk reported
+        if 'label' in partition:
+            return partition['label'] or None
+        
+        partition_device = partition['name']
+        key = (partition_device, drive.serial)
+        if key not in self._label_cache:
+            self._label_cache[key] = self._read_label(partition_device)
+        return self._label_cache[key]
+    
+    def _read_label(self, partition_device: str) -> Optional[str]:
+        """
+        Read a partition's filesystem label with blkid.
+        
+        Args:
+            partition_device: Path to partition device (e.g., /dev/sdc1)
+            
+        Returns:
+            Label or None if not found
+        """
+        try:
+            return self._blkid_tag(partition_device, 'LABEL')
         except Exception:
             return None
-        
-        return None
 
 
 def main():
@@ -7,7 +7,7 @@ the Weirding Module setup process with safety checks and clear feedback.
 """
 
 import questionary
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
@@ -23,17 +23,44 @@ from device_setup import DriveInfo, DriveDetector
 from base_images import BaseImageCatalog, BaseImage
 
 
-class WeirdingUI:
-    """Interactive user interface for Weirding Module setup."""
-    
-    def __init__(self):
-        self.console = Console()
-        self.detector = DriveDetector()
-        self.image_catalog = BaseImageCatalog()
-        
-    def show_welcome(self):
-        """Display welcome message and project overview."""
-        welcome_text = """
+def _bullets(*items: str) -> Text:
+    """Bulleted lines of plain text (not parsed as markup)."""
+    return Text("\n".join(f"• {item}" for item in items))
+
+
+def _fields(*fields: Tuple[str, str]) -> Text:
+    """Lines of a bold 'Label:' followed by a plain-text value."""
+    text = Text()
+    for index, (label, value) in enumerate(fields):
+        if index:
+            text.append("\n")
+        text.append(f"{label}:", style="bold")
+        text.append(f" {value}")
+    return text
+
+
+# questionary styles, built once instead of per prompt; drive selection also
+# colours selected items and separators
+_PROMPT_STYLE = questionary.Style([
+    ('question', 'bold'),
+    ('answer', 'fg:#ff9d00 bold'),
+    ('pointer', 'fg:#ff9d00 bold'),
+    ('highlighted', 'fg:#ff9d00 bold'),
+])
+_DRIVE_SELECT_STYLE = questionary.Style([
+    ('question', 'bold'),
+    ('answer', 'fg:#ff9d00 bold'),
+    ('pointer', 'fg:#ff9d00 bold'),
+    ('highlighted', 'fg:#ff9d00 bold'),
+    ('selected', 'fg:#cc5454'),
+    ('separator', 'fg:#cc5454'),
+    ('instruction', ''),
+    ('text', ''),
+])
+
+# Static welcome screen, parsed from markup once
+_WELCOME_PANEL = Panel(
+    Text.from_markup("""
 [bold blue]Weirding Module Setup Utility[/bold blue]
 
 Transform your external drive into a portable AI server that adapts to any host system.
@@ -47,16 +74,67 @@ Transform your external drive into a portable AI server that adapts to any host
 [red]⚠️  IMPORTANT SAFETY NOTICE ⚠️[/red]
 This process can modify or erase data on your external drive.
 Always backup important data before proceeding.
-        """
-        
-        panel = Panel(
-            welcome_text,
-            title="🚀 Weirding Host Utility",
-            border_style="blue",
-            padding=(1, 2)
-        )
+"""),
+    title="🚀 Weirding Host Utility",
+    border_style="blue",
+    padding=(1, 2)
+)
+
+# Fixed fragments of the analysis and summary panels, built once and reused
+_BLANK = Text()
+_HARDWARE_HEADING = Text("Hardware Information:", style="blue")
+_USAGE_HEADING = Text("Current Usage:", style="blue")
+_MOUNT_HEADING = Text("Mount Status:", style="blue")
+_WARNINGS_HEADING = Text("⚠️  Safety Warnings:", style="red")
+_SUMMARY_HEADING = Text("Setup Summary", style="bold blue")
+_FULL_WIPE_WARNING = Text("⚠️  DESTRUCTIVE OPERATION WARNING ⚠️", style="red")
+_LOST_HEADING = Text("What will be lost:", style="red")
+_FULL_WIPE_CREATES = Group(
+    Text("What will be created:", style="green"),
+    _bullets("EFI boot partition (512MB)",
+             "Weirding Module root partition (~20GB)",
+             "AI model storage partition (remaining space)",
+             "Hardware-adaptive configuration system"),
+)
+_DUAL_USE_WARNING = Text("⚠️  PARTITION MODIFICATION WARNING ⚠️", style="yellow")
+_PRESERVED_HEADING = Text("What will be preserved:", style="green")
+_DUAL_USE_CREATES_HEADING = Text("What will be created:", style="blue")
+_NEXT_STEPS_HEADING = Text("Next Steps After Confirmation:", style="bold yellow")
+
+# Static sections of the completion summary
+_COMPLETION_HEADING = Text("🎉 Weirding Module Setup Complete!", style="bold green")
+_READY_HEADING = Text("Your new Weirding Module is ready:", style="bold")
+_INSTALLED_SECTION = Text.from_markup("""[bold blue]What's been installed:[/bold blue]
+• Minimal Debian Linux OS with hardware detection
+• Ollama container runtime for LLM serving
+• HuggingFace Transformers and PyTorch
+• Hardware-adaptive performance optimization
+• Initial AI model cache structure""")
+_COMPLETION_STEPS_HEADING = Text("Next Steps:", style="bold yellow")
+_COMPLETION_STEPS = Text.from_markup("""2. Test on different computers to see hardware adaptation
+3. Download AI models: [code]ollama pull llama2[/code]
+4. Access via web interface: [code]http://localhost:11434[/code]""")
+_USAGE_TIPS_SECTION = Text.from_markup("""[bold cyan]Usage Tips:[/bold cyan]
+• The module will auto-detect GPU/CPU capabilities on each host
+• Models are cached locally for offline use
+• Performance scales automatically with available hardware
+• Use [code]python main.py setup-host[/code] to optimize host systems""")
+_COMPLETION_FOOTER = Text("Your portable AI server is ready to go! 🚀", style="green")
+
+
+class WeirdingUI:
+    """Interactive user interface for Weirding Module setup."""
+    
+    def __init__(self):
+        self.console = Console()
+        self.detector = DriveDetector()
+        self.image_catalog = BaseImageCatalog()
+        # (drives shown by scan_and_display_drives, the suitable ones among them)
+        self._displayed_drives: Optional[Tuple[List[DriveInfo], List[DriveInfo]]] = None
         
-        self.console.print(panel)
+    def show_welcome(self):
+        """Display welcome message and project overview."""
+        self.console.print(_WELCOME_PANEL)
         self.console.print()
         
         if not Confirm.ask("Do you want to continue with the setup?", default=True):
@@ -76,11 +154,9 @@ Always backup important data before proceeding.
             transient=True
         ) as progress:
             task = progress.add_task("Detecting storage devices...", total=None)
-            drives = self.detector.scan_drives()
+            external_drives = self.detector.scan_drives(external_only=True)
             progress.update(task, completed=100)
         
-        external_drives = self.detector.get_external_drives()
-        
         if not external_drives:
             self.console.print("[red]No suitable external drives found.[/red]")
             self.console.print("Please connect an external drive (32GB or larger) and try again.")
@@ -95,9 +171,12 @@ Always backup important data before proceeding.
         table.add_column("Status", style="red")
         table.add_column("Suitable", style="bold")
         
+        suitable_drives = []
         for drive in external_drives:
             # Check requirements
             meets_req, issues = self.detector.check_drive_requirements(drive)
+            if meets_req:
+                suitable_drives.append(drive)
             
             # Format status
             status_parts = []
@@ -118,7 +197,10 @@ Always backup important data before proceeding.
                 suitable
             )
         
+        # select_drive analyzes every suitable drive; start that while the table prints
+        self.detector.prefetch_drive_usage(suitable_drives)
         self.console.print(table)
+        self._displayed_drives = (external_drives, suitable_drives)
         return external_drives
     
     def select_drive(self, drives: List[DriveInfo]) -> Optional[DriveInfo]:
@@ -126,8 +208,11 @@ Always backup important data before proceeding.
         if not drives:
             return None
         
-        # Filter to only suitable drives
-        suitable_drives = [d for d in drives if self.detector.check_drive_requirements(d)[0]]
+        # Filter to only suitable drives, already known for the drives just displayed
+        if self._displayed_drives is not None and self._displayed_drives[0] is drives:
+            suitable_drives = self._displayed_drives[1]
+        else:
+            suitable_drives = [d for d in drives if self.detector.is_suitable(d)]
         
         if not suitable_drives:
             self.console.print("\n[red]No drives meet the minimum requirements for Weirding Module setup.[/red]")
@@ -152,16 +237,7 @@ Always backup important data before proceeding.
         selected_drive = questionary.select(
             "Select the drive to convert into a Weirding Module:",
             choices=choices,
-            style=questionary.Style([
-                ('question', 'bold'),
-                ('answer', 'fg:#ff9d00 bold'),
-                ('pointer', 'fg:#ff9d00 bold'),
-                ('highlighted', 'fg:#ff9d00 bold'),
-                ('selected', 'fg:#cc5454'),
-                ('separator', 'fg:#cc5454'),
-                ('instruction', ''),
-                ('text', ''),
-            ])
+            style=_DRIVE_SELECT_STYLE
         ).ask()
         
         return selected_drive
@@ -169,36 +245,35 @@ Always backup important data before proceeding.
     def show_drive_analysis(self, drive: DriveInfo) -> Dict:
         """Display detailed analysis of the selected drive."""
         analysis = self.detector.analyze_drive_usage(drive)
-        
-        # Create analysis panel
-        analysis_text = f"""
-[bold]Drive Analysis: {drive.device}[/bold]
-
-[blue]Hardware Information:[/blue]
-• Model: {drive.model} ({drive.vendor})
-• Size: {self.detector.format_size(drive.size)}
-• Connection: {drive.connection_type}
-• Serial: {drive.serial}
-
-[blue]Current Usage:[/blue]
-• Total Space: {self.detector.format_size(analysis['total_size'])}
-• Used Space: {self.detector.format_size(analysis['used_space'])}
-• Free Space: {self.detector.format_size(analysis['free_space'])}
-• Partitions: {analysis['partition_count']}
-• Filesystem Types: {', '.join(analysis['filesystem_types']) if analysis['filesystem_types'] else 'None'}
-
-[blue]Mount Status:[/blue]
-• Currently Mounted: {'Yes' if analysis['mount_status'] else 'No'}
-• Mount Points: {', '.join(drive.mount_points) if drive.mount_points else 'None'}
-        """
+        format_size = self.detector.format_size
+        
+        # Create analysis panel; drive details stay plain text, never markup
+        parts = [
+            Text(f"Drive Analysis: {drive.device}", style="bold"),
+            _BLANK,
+            _HARDWARE_HEADING,
+            _bullets(f"Model: {drive.model} ({drive.vendor})",
+                     f"Size: {format_size(drive.size)}",
+                     f"Connection: {drive.connection_type}",
+                     f"Serial: {drive.serial}"),
+            _BLANK,
+            _USAGE_HEADING,
+            _bullets(f"Total Space: {format_size(analysis['total_size'])}",
+                     f"Used Space: {format_size(analysis['used_space'])}",
+                     f"Free Space: {format_size(analysis['free_space'])}",
+                     f"Partitions: {analysis['partition_count']}",
+                     f"Filesystem Types: {', '.join(analysis['filesystem_types']) or 'None'}"),
+            _BLANK,
+            _MOUNT_HEADING,
+            _bullets(f"Currently Mounted: {'Yes' if analysis['mount_status'] else 'No'}",
+                     f"Mount Points: {', '.join(drive.mount_points) or 'None'}"),
+        ]
         
         if analysis['safety_warnings']:
-            analysis_text += f"\n[red]⚠️  Safety Warnings:[/red]\n"
-            for warning in analysis['safety_warnings']:
-                analysis_text += f"• {warning}\n"
+            parts += [_BLANK, _WARNINGS_HEADING, _bullets(*analysis['safety_warnings'])]
         
         panel = Panel(
-            analysis_text.strip(),
+            Group(*parts),
             title=f"📊 Drive Analysis",
             border_style="yellow",
             padding=(1, 2)
@@ -266,12 +341,7 @@ Always backup important data before proceeding.
         selected_mode = questionary.select(
             "Choose setup mode:",
             choices=[{'name': mode['name'], 'value': mode['value']} for mode in modes],
-            style=questionary.Style([
-                ('question', 'bold'),
-                ('answer', 'fg:#ff9d00 bold'),
-                ('pointer', 'fg:#ff9d00 bold'),
-                ('highlighted', 'fg:#ff9d00 bold'),
-            ])
+            style=_PROMPT_STYLE
         ).ask()
         
         return selected_mode
@@ -359,12 +429,7 @@ Always backup important data before proceeding.
             selected = questionary.select(
                 "Choose a base operating system image:",
                 choices=choices,
-                style=questionary.Style([
-                    ('question', 'bold'),
-                    ('answer', 'fg:#ff9d00 bold'),
-                    ('pointer', 'fg:#ff9d00 bold'),
-                    ('highlighted', 'fg:#ff9d00 bold'),
-                ])
+                style=_PROMPT_STYLE
             ).ask()
             
             if not selected:
@@ -478,12 +543,7 @@ Always backup important data before proceeding.
         choice = questionary.select(
             "Choose how to name your Weirding Module:",
             choices=naming_choices,
-            style=questionary.Style([
-                ('question', 'bold'),
-                ('answer', 'fg:#ff9d00 bold'),
-                ('pointer', 'fg:#ff9d00 bold'),
-                ('highlighted', 'fg:#ff9d00 bold'),
-            ])
+            style=_PROMPT_STYLE
         ).ask()
         
         if not choice:
@@ -585,79 +645,88 @@ Always backup important data before proceeding.
     def show_setup_summary(self, drive: DriveInfo, mode: str, analysis: Dict, module_name: str = None, base_image = None) -> bool:
         """Show final setup summary and get confirmation."""
         
+        format_size = self.detector.format_size
+        
         if mode == 'full_wipe':
-            impact_text = f"""
-[red]⚠️  DESTRUCTIVE OPERATION WARNING ⚠️[/red]
-
-[bold]This will PERMANENTLY ERASE ALL DATA on {drive.device}[/bold]
-
-[red]What will be lost:[/red]
-• All {analysis['partition_count']} existing partitions
-• All files and data ({self.detector.format_size(analysis['used_space'])} of data)
-• Current filesystem configuration
-
-[green]What will be created:[/green]
-• EFI boot partition (512MB)
-• Weirding Module root partition (~20GB)
-• AI model storage partition (remaining space)
-• Hardware-adaptive configuration system
-            """
+            impact = [
+                _FULL_WIPE_WARNING,
+                _BLANK,
+                Text(f"This will PERMANENTLY ERASE ALL DATA on {drive.device}", style="bold"),
+                _BLANK,
+                _LOST_HEADING,
+                _bullets(f"All {analysis['partition_count']} existing partitions",
+                         f"All files and data ({format_size(analysis['used_space'])} of data)",
+                         "Current filesystem configuration"),
+                _BLANK,
+                _FULL_WIPE_CREATES,
+            ]
         else:  # dual_use
             weirding_size = min(analysis['free_space'], 50 * 1024**3)  # Use up to 50GB
-            impact_text = f"""
-[yellow]⚠️  PARTITION MODIFICATION WARNING ⚠️[/yellow]
-
-[bold]This will modify the partition table on {drive.device}[/bold]
-
-[green]What will be preserved:[/green]
-• All existing partitions and data
-• Current mount points and filesystem types
-• {self.detector.format_size(analysis['used_space'])} of existing data
-
-[blue]What will be created:[/blue]
-• New Weirding Module partition (~{self.detector.format_size(weirding_size)})
-• Bootloader configuration for dual-boot capability
-• Hardware-adaptive AI stack installation
-            """
+            impact = [
+                _DUAL_USE_WARNING,
+                _BLANK,
+                Text(f"This will modify the partition table on {drive.device}", style="bold"),
+                _BLANK,
+                _PRESERVED_HEADING,
+                _bullets("All existing partitions and data",
+                         "Current mount points and filesystem types",
+                         f"{format_size(analysis['used_space'])} of existing data"),
+                _BLANK,
+                _DUAL_USE_CREATES_HEADING,
+                _bullets(f"New Weirding Module partition (~{format_size(weirding_size)})",
+                         "Bootloader configuration for dual-boot capability",
+                         "Hardware-adaptive AI stack installation"),
+            ]
+        
+        summary_fields = [
+            ("Target Drive", drive.device),
+            ("Model", f"{drive.model} ({drive.vendor})"),
+            ("Size", format_size(drive.size)),
+            ("Mode", mode.replace('_', ' ').title()),
+            ("Module Name", module_name if module_name else 'No custom name set'),
+        ]
         
         # Base image information
-        base_image_info = ""
+        image_cached = False
         if base_image:
-            cached_status = "locally cached" if self.image_catalog.is_image_cached(base_image) else f"will download {self.image_catalog.format_size(base_image.size_mb)}"
+            image_cached = self.image_catalog.is_image_cached(base_image)
+            cached_status = "locally cached" if image_cached else f"will download {self.image_catalog.format_size(base_image.size_mb)}"
             ai_info = "🤖 AI-optimized" if base_image.ai_optimized else "Standard"
             
-            base_image_info = f"""
-[bold]Base Image:[/bold] {base_image.name} v{base_image.version} ({ai_info})
-[bold]Image Size:[/bold] {self.image_catalog.format_size(base_image.size_mb)} ({cached_status})
-[bold]Description:[/bold] {base_image.description}"""
-        
-        summary_text = f"""
-[bold blue]Setup Summary[/bold blue]
-
-[bold]Target Drive:[/bold] {drive.device}
-[bold]Model:[/bold] {drive.model} ({drive.vendor})
-[bold]Size:[/bold] {self.detector.format_size(drive.size)}
-[bold]Mode:[/bold] {mode.replace('_', ' ').title()}
-[bold]Module Name:[/bold] {module_name if module_name else 'No custom name set'}{base_image_info}
-
-{impact_text}
-
-[bold yellow]Next Steps After Confirmation:[/bold yellow]
-1. Unmount drive (if mounted)
-2. Backup partition table
-3. Create/modify partitions
-4. Install bootloader
-5. {"Download and install base OS image" if base_image else "Install minimal Debian OS"}
-6. Install AI stack (Ollama, HuggingFace, PyTorch)
-7. Configure hardware detection
-8. Download initial AI models
-9. Verify installation
-
-[bold]Estimated Time:[/bold] {"15-30 minutes" if base_image and self.image_catalog.is_image_cached(base_image) else "30-60 minutes"} depending on internet speed
-        """
+            summary_fields += [
+                ("Base Image", f"{base_image.name} v{base_image.version} ({ai_info})"),
+                ("Image Size", f"{self.image_catalog.format_size(base_image.size_mb)} ({cached_status})"),
+                ("Description", base_image.description),
+            ]
+        
+        next_steps = Text("\n".join(f"{number}. {step}" for number, step in enumerate([
+            "Unmount drive (if mounted)",
+            "Backup partition table",
+            "Create/modify partitions",
+            "Install bootloader",
+            "Download and install base OS image" if base_image else "Install minimal Debian OS",
+            "Install AI stack (Ollama, HuggingFace, PyTorch)",
+            "Configure hardware detection",
+            "Download initial AI models",
+            "Verify installation",
+        ], 1)))
+        estimated_time = "15-30 minutes" if image_cached else "30-60 minutes"
+        
+        summary = Group(
+            _SUMMARY_HEADING,
+            _BLANK,
+            _fields(*summary_fields),
+            _BLANK,
+            *impact,
+            _BLANK,
+            _NEXT_STEPS_HEADING,
+            next_steps,
+            _BLANK,
+            _fields(("Estimated Time", f"{estimated_time} depending on internet speed")),
+        )
         
         panel = Panel(
-            summary_text.strip(),
+            summary,
             title="🚨 Final Confirmation Required",
             border_style="red" if mode == 'full_wipe' else "yellow",
             padding=(1, 2)
@@ -722,46 +791,47 @@ Always backup important data before proceeding.
         
         self.console.print(panel)
     
-    def show_completion_summary(self, drive: DriveInfo, mode: str):
-        """Show final completion summary with next steps."""
-        completion_text = f"""
-[bold green]🎉 Weirding Module Setup Complete![/bold green]
-
-[bold]Your new Weirding Module is ready:[/bold]
-• Device: {drive.device}
-• Model: {drive.model}
-• Mode: {mode.replace('_', ' ').title()}
-
-[bold blue]What's been installed:[/bold blue]
-• Minimal Debian Linux OS with hardware detection
-• Ollama container runtime for LLM serving
-• HuggingFace Transformers and PyTorch
-• Hardware-adaptive performance optimization
-• Initial AI model cache structure
-
-[bold yellow]Next Steps:[/bold yellow]
-1. Safely eject the drive: [code]sudo umount {drive.device}*[/code]
-2. Test on different computers to see hardware adaptation
-3. Download AI models: [code]ollama pull llama2[/code]
-4. Access via web interface: [code]http://localhost:11434[/code]
-
-[bold cyan]Usage Tips:[/bold cyan]
-• The module will auto-detect GPU/CPU capabilities on each host
-• Models are cached locally for offline use
-• Performance scales automatically with available hardware
-• Use [code]python main.py setup-host[/code] to optimize host systems
-
-[green]Your portable AI server is ready to go! 🚀[/green]
+    def show_completion_summary(self, drive: DriveInfo, mode: str,
+                                status_lines: Optional[List[str]] = None):
         """
+        Show final completion summary with next steps.
+        
+        Args:
+            drive: Drive the module was created on
+            mode: Setup mode that was used
+            status_lines: Optional status messages rendered above the summary panel
+        """
+        # Only the drive details and eject command vary; the rest is prebuilt
+        completion = Group(
+            _COMPLETION_HEADING,
+            _BLANK,
+            _READY_HEADING,
+            _bullets(f"Device: {drive.device}",
+                     f"Model: {drive.model}",
+                     f"Mode: {mode.replace('_', ' ').title()}"),
+            _BLANK,
+            _INSTALLED_SECTION,
+            _BLANK,
+            _COMPLETION_STEPS_HEADING,
+            Text.assemble("1. Safely eject the drive: ", (f"sudo umount {drive.device}*", "code")),
+            _COMPLETION_STEPS,
+            _BLANK,
+            _USAGE_TIPS_SECTION,
+            _BLANK,
+            _COMPLETION_FOOTER,
+        )
         
         panel = Panel(
-            completion_text.strip(),
+            completion,
             title="Setup Complete",
             border_style="green",
             padding=(1, 2)
         )
         
-        self.console.print(panel)
+        if status_lines:
+            self.console.print(Group(*status_lines, panel))
+        else:
+            self.console.print(panel)
 
 
 def main():
@@ -8,6 +8,7 @@ onto Weirding Modules using debootstrap and custom configurations.
 
 import subprocess
 import os
+import errno
 import tempfile
 import shutil
 import urllib.request
@@ -19,6 +20,11 @@ import time
 from device_setup import DriveInfo
 from partitioner import PartitionPlan
 
+# Block size used when streaming an ISO onto the target drive. Throughput on
+# USB sticks keeps climbing up to a few MiB per write, so stay well past the
+# small-block range where writes stall at a fraction of the bus speed.
+ISO_WRITE_BLOCK_SIZE = 4 * 1024 * 1024
+
 
 class OSInstaller:
     """Handles OS installation for Weirding Modules."""
@@ -109,70 +115,21 @@ class OSInstaller:
                 progress_callback("Writing ISO to drive (this may take several minutes)...")
             
             print(f"💾 Writing {iso_path} to {device}...")
+            print(f"🔧 Copying in {ISO_WRITE_BLOCK_SIZE // (1024 * 1024)}M chunks with fsync on completion")
             
-            # Use dd to write ISO directly to device with USB 4.0 compatibility
-            # USB 4.0 drives need smaller block sizes and different sync options for compatibility
-            dd_cmd = [
-                'dd',
-                f'if={iso_path}',
-                f'of={device}',
-                'bs=1M',          # Smaller block size for USB 4.0 compatibility
-                'status=progress',
-                'conv=fsync',     # File system sync (more compatible than fdatasync)
-                'oflag=direct'    # Direct I/O for better reliability
-            ]
-            
-            print(f"🔧 Using USB 4.0 compatible parameters: bs=1M, conv=fsync, oflag=direct")
-            
-            # Capture both stdout and stderr separately for better diagnostics
-            process = subprocess.Popen(
-                dd_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
-            
-            # Monitor progress and capture all output
-            dd_output = []
-            dd_errors = []
-            
-            while True:
-                # Read from both stdout and stderr
-                stdout_line = process.stdout.readline()
-                stderr_line = process.stderr.readline()
-                
-                if stdout_line == '' and stderr_line == '' and process.poll() is not None:
-                    break
-                    
-                if stdout_line:
-                    dd_output.append(stdout_line.strip())
-                    print(f"DD OUTPUT: {stdout_line.strip()}")
-                    if progress_callback and "copied" in stdout_line.lower():
-                        progress_callback("Writing ISO to drive...")
-                        
-                if stderr_line:
-                    dd_errors.append(stderr_line.strip())
-                    print(f"DD STATUS: {stderr_line.strip()}")
-                    if progress_callback and ("MB" in stderr_line or "GB" in stderr_line):
-                        progress_callback("Writing ISO to drive...")
-            
-            return_code = process.poll()
+            def report(bytes_written):
+                if progress_callback and iso_size:
+                    progress_callback("Writing ISO to drive...", bytes_written * 100 // iso_size)
             
-            # Print final dd statistics
-            print(f"📊 DD command completed with return code: {return_code}")
-            if dd_output:
-                print("📋 DD Output:")
-                for line in dd_output[-5:]:  # Show last 5 lines
-                    print(f"  {line}")
-            if dd_errors:
-                print("📋 DD Status/Errors:")
-                for line in dd_errors[-5:]:  # Show last 5 lines
-                    print(f"  {line}")
+            try:
+                bytes_written = self._copy_image_to_device(iso_path, device, iso_size, report)
+            except OSError as e:
+                print(f"❌ Error writing ISO to drive: {e}")
+                return False
             
-            if return_code != 0:
-                print(f"❌ DD command failed with return code: {return_code}")
+            print(f"📊 Wrote {bytes_written:,} bytes to {device}")
+            if bytes_written != iso_size:
+                print(f"❌ Short write: expected {iso_size:,} bytes, wrote {bytes_written:,}")
                 return False
             
             # Step 3: Sync and wait for write completion
@@ -216,6 +173,54 @@ class OSInstaller:
             traceback.print_exc()
             return False
     
+    def _copy_image_to_device(self, iso_path: str, device: str, iso_size: int, report=None) -> int:
+        """
+        Copy an image onto a device in ISO_WRITE_BLOCK_SIZE chunks.
+        
+        Uses os.sendfile so the data never passes through Python, falling back
+        to a reusable buffer with readinto/write where sendfile is unavailable.
+        The device is fsync'd before returning.
+        
+        Returns:
+            Number of bytes written
+        """
+        written = 0
+        src_fd = os.open(iso_path, os.O_RDONLY)
+        try:
+            dst_fd = os.open(device, os.O_WRONLY)
+            try:
+                try:
+                    while written < iso_size:
+                        sent = os.sendfile(dst_fd, src_fd, written, min(ISO_WRITE_BLOCK_SIZE, iso_size - written))
+                        if sent == 0:
+                            break
+                        written += sent
+                        if report:
+                            report(written)
+                except (AttributeError, OSError) as e:
+                    if written or getattr(e, 'errno', None) not in (None, errno.EINVAL, errno.ENOSYS):
+                        raise
+                    # sendfile is not supported for this pair of descriptors
+                    buffer = bytearray(ISO_WRITE_BLOCK_SIZE)
+                    view = memoryview(buffer)
+                    with open(src_fd, 'rb', buffering=0, closefd=False) as src:
+                        while True:
+                            count = src.readinto(buffer)
+                            if not count:
+                                break
+                            offset = 0
+                            while offset < count:
+                                offset += os.write(dst_fd, view[offset:count])
+                            written += count
+                            if report:
+                                report(written)
+                os.fsync(dst_fd)
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        return written
+    
     def _verify_iso_integrity(self, iso_path: str, progress_callback=None) -> bool:
         """Verify ISO file integrity and bootability signatures."""
         try:
@@ -368,7 +373,7 @@ class OSInstaller:
     def _add_weirding_config(self, plan: PartitionPlan) -> bool:
         """Add Weirding-specific configuration to the bootable drive."""
         try:
-            # Wait for drive to settle after dd
+            # Wait for drive to settle after writing the image
             time.sleep(2)
             
             # Create a simple weirding configuration file
@@ -16,7 +16,7 @@ from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
-from device_setup import DriveInfo
+from device_setup import DriveInfo, SIZE_MULTIPLIERS
 
 
 @dataclass
@@ -569,39 +569,38 @@ class DrivePartitioner:
     
     def _parse_size_to_bytes(self, size_str: str) -> int:
         """Convert size string to bytes (reuse from DriveDetector)."""
+        if isinstance(size_str, int):
+            return size_str
+        
         if not size_str:
             return 0
         
-        import re
         size_str = size_str.strip()
-        match = re.match(r'([0-9.]+)([KMGTPE]?)', size_str.upper())
-        if not match:
+        if size_str.isdigit():
+            return int(size_str)
+        
+        # Leading digits/dots, then one optional suffix letter
+        end = 0
+        length = len(size_str)
+        while end < length and (size_str[end].isdigit() or size_str[end] == '.'):
+            end += 1
+        if end == 0:
             return 0
         
-        number = float(match.group(1))
-        unit = match.group(2)
-        
-        multipliers = {
-            '': 1, 'K': 1024, 'M': 1024**2, 'G': 1024**3,
-            'T': 1024**4, 'P': 1024**5, 'E': 1024**6
-        }
-        
-        return int(number * multipliers.get(unit, 1))
+        return int(float(size_str[:end]) * SIZE_MULTIPLIERS.get(size_str[end:end + 1].upper(), 1))
     
     def _unmount_all_partitions(self, drive: DriveInfo):
         """Unmount all partitions on the drive."""
         try:
             # Get all mounted partitions for this device
             result = subprocess.run(['mount'], capture_output=True, text=True)
-            mount_lines = result.stdout.split('\n')
-            
-            partitions_to_unmount = []
-            for line in mount_lines:
-                if drive.device in line:
-                    parts = line.split()
-                    if len(parts) > 0:
-                        partition = parts[0]
-                        partitions_to_unmount.append(partition)
+            
+            # The mounted source is the first field of each "mount" line
+            partitions_to_unmount = [
+                line.partition(' ')[0]
+                for line in result.stdout.splitlines()
+                if drive.device in line
+            ]
             
             # Unmount each partition
             for partition in partitions_to_unmount:
@@ -61,6 +61,10 @@ class TestBaseImageCatalog(unittest.TestCase):
             self.assertIsInstance(image.version, str)
             self.assertIsInstance(image.size_mb, int)
             self.assertIsInstance(image.ai_optimized, bool)
+        
+        # Frozen images are hashable, so they can key a dict
+        by_image = {image: image.id for image in images}
+        self.assertEqual(by_image[images[0]], images[0].id)
     
     def test_format_size(self):
         """Test size formatting functionality."""
@@ -12,6 +12,7 @@ import subprocess
 import json
 import sys
 import os
+import tempfile
 from pathlib import Path
 
 # Add modules directory to path for testing
@@ -129,8 +130,9 @@ class TestDriveDetector(unittest.TestCase):
                 result = self.detector.format_size(int(bytes_size))
                 self.assertEqual(result, expected_str)
     
+    @patch.object(DriveDetector, '_sysfs_scan', return_value=None)
     @patch('subprocess.run')
-    def test_scan_drives_success(self, mock_run):
+    def test_scan_drives_success(self, mock_run, mock_sysfs):
         """Test successful drive scanning."""
         # Mock successful lsblk command
         mock_run.return_value = MagicMock(
@@ -163,16 +165,18 @@ class TestDriveDetector(unittest.TestCase):
         self.assertFalse(internal_drive.is_external)
         self.assertEqual(internal_drive.connection_type, "NVME")
     
+    @patch.object(DriveDetector, '_sysfs_scan', return_value=None)
     @patch('subprocess.run')
-    def test_scan_drives_command_failure(self, mock_run):
+    def test_scan_drives_command_failure(self, mock_run, mock_sysfs):
         """Test drive scanning when lsblk command fails."""
         mock_run.side_effect = subprocess.CalledProcessError(1, 'lsblk')
         
         drives = self.detector.scan_drives()
         self.assertEqual(len(drives), 0)
     
+    @patch.object(DriveDetector, '_sysfs_scan', return_value=None)
     @patch('subprocess.run')
-    def test_scan_drives_json_parse_error(self, mock_run):
+    def test_scan_drives_json_parse_error(self, mock_run, mock_sysfs):
         """Test drive scanning when JSON parsing fails."""
         mock_run.return_value = MagicMock(
             stdout="invalid json",
@@ -182,6 +186,93 @@ class TestDriveDetector(unittest.TestCase):
         drives = self.detector.scan_drives()
         self.assertEqual(len(drives), 0)
     
+    @patch.object(DriveDetector, '_sysfs_scan', return_value=None)
+    @patch('subprocess.run')
+    def test_scan_drives_reuses_unchanged_scan(self, mock_run, mock_sysfs):
+        """Test that a repeated scan is skipped until devices or mounts change."""
+        mock_run.return_value = MagicMock(
+            stdout=json.dumps(self.sample_lsblk_output),
+            returncode=0
+        )
+        self.detector._uevent_sock = MagicMock()
+        self.detector._mountinfo_poll = MagicMock()
+        
+        with patch.object(DriveDetector, '_devices_changed', return_value=False):
+            drives = self.detector.scan_drives()
+            self.assertIs(self.detector.scan_drives(), drives)
+            self.assertEqual(mock_run.call_count, 1)
+            
+            # A different filter still needs a real scan
+            self.detector.scan_drives(external_only=True)
+            self.assertEqual(mock_run.call_count, 2)
+        
+        with patch.object(DriveDetector, '_devices_changed', return_value=True):
+            self.detector.scan_drives(external_only=True)
+            self.assertEqual(mock_run.call_count, 3)
+    
+    def test_sysfs_scan(self):
+        """Test building lsblk-style device data from a sysfs tree."""
+        with tempfile.TemporaryDirectory() as root:
+            usb_dir = os.path.join(root, "devices", "pci0000:00", "usb2", "2-1", "block", "sdc")
+            os.makedirs(os.path.join(usb_dir, "device"))
+            os.makedirs(os.path.join(usb_dir, "sdc1"))
+            os.makedirs(os.path.join(usb_dir, "sdc2"))
+            files = {
+                "size": "3907029168", "removable": "0", "dev": "8:32",
+                "device/model": "PSSD T7 Shield", "device/vendor": "Samsung",
+                "sdc1/size": "3907026944", "sdc1/partition": "1", "sdc1/dev": "8:33",
+                "sdc2/size": "2048", "sdc2/partition": "2", "sdc2/dev": "8:34",
+            }
+            for name, content in files.items():
+                with open(os.path.join(usb_dir, name), "w") as f:
+                    f.write(content + "\n")
+            
+            block_dir = os.path.join(root, "block")
+            os.makedirs(os.path.join(block_dir, "loop0"))
+            os.symlink(usb_dir, os.path.join(block_dir, "sdc"))
+            
+            mountinfo = os.path.join(root, "mountinfo")
+            with open(mountinfo, "w") as f:
+                f.write("98 29 8:33 / /media/T7\\040Shield rw,relatime shared:1 - exfat /dev/sdc1 rw\n")
+                # btrfs reports an anonymous device number, so only the source identifies it
+                f.write("99 29 0:45 / /media/data rw,relatime shared:2 - btrfs /dev/sdc2 rw,subvol=/\n")
+            
+            udev_dir = os.path.join(root, "udev")
+            os.makedirs(udev_dir)
+            with open(os.path.join(udev_dir, "b8:33"), "w") as f:
+                f.write("E:ID_FS_TYPE=exfat\nE:ID_FS_LABEL_ENC=T7\\x20Shield\n")
+            
+            with patch('device_setup.SYS_BLOCK_DIR', block_dir), \
+                 patch('device_setup.UDEV_DATA_DIR', udev_dir), \
+                 patch('device_setup.MOUNTINFO_PATH', mountinfo):
+                data = self.detector._sysfs_scan()
+                external = self.detector._sysfs_scan(external_only=True)
+                with patch('device_setup._sysfs_transport', return_value='nvme'):
+                    internal_skipped = self.detector._sysfs_scan(external_only=True)
+        
+        self.assertEqual(len(data['blockdevices']), 1)
+        device = data['blockdevices'][0]
+        self.assertEqual(device['name'], "sdc")
+        self.assertEqual(device['type'], "disk")
+        self.assertEqual(device['size'], 3907029168 * 512)
+        self.assertEqual(device['tran'], "usb")
+        self.assertFalse(device['rm'])
+        self.assertEqual(device['model'], "PSSD T7 Shield")
+        
+        partition = device['children'][0]
+        self.assertEqual(partition['name'], "sdc1")
+        self.assertEqual(partition['fstype'], "exfat")
+        self.assertEqual(partition['label'], "T7 Shield")
+        self.assertEqual(partition['mountpoint'], "/media/T7 Shield")
+        self.assertEqual(device['children'][1]['mountpoint'], "/media/data")
+        
+        self.assertEqual(external['blockdevices'], data['blockdevices'])
+        self.assertEqual(internal_skipped['blockdevices'], [])
+        
+        drive = self.detector._parse_drive_info(device)
+        self.assertTrue(drive.is_external)
+        self.assertEqual(drive.connection_type, "USB")
+    
     def test_get_external_drives(self):
         """Test filtering for external drives only."""
         # Create test drives
@@ -216,6 +307,7 @@ class TestDriveDetector(unittest.TestCase):
         )
         
         meets_req, issues = self.detector.check_drive_requirements(good_drive)
+        self.assertEqual(self.detector.is_suitable(good_drive), meets_req)
         self.assertTrue(meets_req)
         self.assertEqual(len(issues), 0)
         
@@ -228,6 +320,7 @@ class TestDriveDetector(unittest.TestCase):
         )
         
         meets_req, issues = self.detector.check_drive_requirements(small_drive)
+        self.assertEqual(self.detector.is_suitable(small_drive), meets_req)
         self.assertFalse(meets_req)
         self.assertIn("Drive too small", issues[0])
         
@@ -240,6 +333,7 @@ class TestDriveDetector(unittest.TestCase):
         )
         
         meets_req, issues = self.detector.check_drive_requirements(internal_drive)
+        self.assertEqual(self.detector.is_suitable(internal_drive), meets_req)
         self.assertFalse(meets_req)
         self.assertIn("not appear to be external", issues[0])
         self.assertIn("Unusual connection type", issues[1])
@@ -280,6 +374,28 @@ class TestDriveDetector(unittest.TestCase):
         self.assertIn("Drive is currently mounted", analysis['safety_warnings'])
         self.assertIn("Drive has 1 existing partitions", analysis['safety_warnings'])
     
+    @patch('os.statvfs')
+    def test_prefetch_drive_usage(self, mock_statvfs):
+        """Test that a prefetched analysis is handed to analyze_drive_usage."""
+        mock_statvfs.return_value = MagicMock(f_frsize=4096, f_blocks=1000, f_bavail=250)
+        test_drive = DriveInfo(
+            device="/dev/sdc", size=4*1024**3, model="Test Drive",
+            vendor="Test", serial="123", removable=True, mounted=True,
+            mount_points=["/media/test"],
+            partitions=[{'name': 'sdc1', 'size': 4*1024**3, 'fstype': 'ext4', 'mountpoint': '/media/test'}],
+            filesystem_type="ext4", usage_percent=None,
+            is_external=True, connection_type="USB"
+        )
+        
+        self.detector.prefetch_drive_usage([test_drive])
+        self.assertIn("/dev/sdc", self.detector._usage_pending)
+        
+        analysis = self.detector.analyze_drive_usage(test_drive)
+        self.assertEqual(analysis['used_space'], 4096 * 750)
+        self.assertNotIn("/dev/sdc", self.detector._usage_pending)
+        self.assertIs(self.detector.analyze_drive_usage(test_drive), analysis)
+        mock_statvfs.assert_called_once_with('/media/test')
+    
     @patch('subprocess.run')
     def test_get_current_label_success(self, mock_run):
         """Test getting current drive label successfully."""